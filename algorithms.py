@@ -0,0 +1,114 @@
+# UI-free algorithm core: step-trace producing graph searches and sorts for the apps and headless jobs
+#
+# Importing this module loads only the pure-Python engines; NumPy-backed modules
+# (CSR graphs, integer sorts) load on first use and nothing here touches Streamlit
+# or matplotlib. Pass log=callable(name, trace) to persist the produced traces.
+
+import sorting
+from shortest_paths import astar_search, euclidean_heuristic, reconstruct_path
+from step_trace import StepTrace, visit_trace
+
+def _log(log, name, trace):
+    if log is not None:
+        log(name, trace)
+
+# ----------------- Graph Algorithms -----------------
+
+def to_csr(graph):
+    from csr_graph import CSRGraph
+    return CSRGraph.from_networkx(graph)
+
+def bfs(csr, start_node, ops=None, log=None):
+    from csr_graph import csr_bfs
+    order, levels, parents = csr_bfs(csr, csr.ids[start_node], ops)
+    steps = visit_trace(csr.to_labels(order))
+    _log(log, "bfs_steps", steps)
+    return steps
+
+def dfs(csr, start_node, whole_graph=False, ops=None, log=None):
+    from csr_graph import csr_dfs
+    order, discovery, finish, parents = csr_dfs(csr, csr.ids[start_node], whole_graph, ops)
+    steps = visit_trace(csr.to_labels(order))
+    _log(log, "dfs_steps", steps)
+    return steps
+
+def ucs(csr, start_node, target=None, ops=None, log=None):
+    from csr_graph import csr_dijkstra, csr_path
+    target_id = None if target is None else csr.ids[target]
+    order, costs, parents = csr_dijkstra(csr, csr.ids[start_node], target_id, ops)
+    steps = visit_trace(csr.to_labels(order))
+    _log(log, "ucs_steps", steps)
+    return steps, csr.to_labels(csr_path(parents, target_id)), costs.get(target_id)
+
+def astar(graph, start_node, target, pos, log=None):
+    heuristic = euclidean_heuristic(graph, pos)
+    order, costs, parents = astar_search(graph, start_node, target, heuristic)
+    steps = visit_trace(order)
+    _log(log, "astar_steps", steps)
+    return steps, reconstruct_path(parents, target), costs.get(target)
+
+def run_search(graph, algorithm, start_node, target=None, whole_graph=False, pos=None,
+               ops=None, csr=None, log=None):
+    if algorithm == "A*":
+        return astar(graph, start_node, target, pos, log)
+    if csr is None:
+        csr = to_csr(graph)
+    if algorithm == "BFS":
+        return bfs(csr, start_node, ops, log), None, None
+    if algorithm == "DFS":
+        return dfs(csr, start_node, whole_graph, ops, log), None, None
+    if algorithm == "UCS":
+        return ucs(csr, start_node, target, ops, log)
+    raise ValueError(f"unknown search: {algorithm}")
+
+# ----------------- Sorting Algorithms -----------------
+
+def insertion_sort(arr, ops=None, log=None):
+    trace = StepTrace(arr)
+    sorting.insertion_sort(arr, trace, ops)
+    _log(log, "insertion_sort_steps", trace)
+    return trace
+
+def selection_sort(arr, ops=None, log=None):
+    trace = StepTrace(arr)
+    sorting.selection_sort(arr, trace, ops)
+    _log(log, "selection_sort_steps", trace)
+    return trace
+
+def merge_sort(arr, ops=None, log=None):
+    trace = StepTrace(arr)
+    yield from sorting.merge_sort(arr, trace, ops)
+    _log(log, "merge_sort_steps", trace)
+
+def natural_merge_sort(arr, log=None):
+    trace = StepTrace(arr)
+    yield from sorting.buffered_merge_sort(arr, "natural", steps=True, trace=trace)
+    _log(log, "natural_merge_sort_steps", trace)
+
+def quick_sort(arr, ops=None, log=None):
+    trace = StepTrace(arr)
+    yield from sorting.quick_sort(arr, trace, ops)
+    _log(log, "quick_sort_steps", trace)
+
+def introsort(arr, log=None):
+    trace = StepTrace(arr)
+    yield from sorting.introsort(arr, trace)
+    _log(log, "introsort_steps", trace)
+
+def counting_sort(arr, log=None):
+    import integer_sorts
+    trace = StepTrace(arr)
+    yield from integer_sorts.counting_sort_steps(arr, trace)
+    _log(log, "counting_sort_steps", trace)
+
+def auto_sort(arr, log=None):
+    import integer_sorts
+    trace = StepTrace(arr)
+    yield from integer_sorts.auto_sort_steps(arr, trace)
+    _log(log, "auto_sort_steps", trace)
+
+def radix_sort(arr, log=None):
+    import integer_sorts
+    trace = StepTrace(arr)
+    yield from integer_sorts.radix_sort_steps(arr, trace)
+    _log(log, "radix_sort_steps", trace)
@@ -0,0 +1,634 @@
+# Shared Streamlit UI behind code.py and Test.py: session state, panels and the three tabs
+
+import streamlit as st
+import time
+import csv
+import io
+import json
+import os
+import tempfile
+import algorithms
+import batch
+import external_sort
+import graph_analytics
+import graph_io
+import numpy as np
+from array_io import ARRAY_DISTRIBUTIONS, generate_array, load_array, parse_numbers
+from counters import COUNTERS, OpCounter
+from csr_graph import CSRGraph
+from playback import Player
+from step_trace import StepTrace
+from renderer import ARRAY_VIEWS, apply_frame, export_animation_async, make_array_renderer, make_graph_renderer
+from result_cache import ResultCache
+from trace_log import TraceLogger
+from graph_analytics import ComponentTracker
+from graph_store import GraphStore, convert_graph
+from shortest_paths import DynamicSSSP
+from layout_cache import LAYOUT_METHODS, LayoutCache, default_method
+
+# ----------------- Trace Logging -----------------
+
+@st.cache_resource
+def get_trace_logger():
+    # One logger (and writer thread) per server process, not one per script rerun.
+    return TraceLogger("logs")
+
+def save_log(filename, trace):
+    return get_trace_logger().submit(filename, trace.events, trace.initial)
+
+# ----------------- Graph Visualization Functions -----------------
+
+def draw_graph(app, graph, visited_nodes, pos, color='red', groups=None):
+    renderer = app["graph_renderer"](graph, pos, app["zoom"], color, graph.is_directed(), groups)
+    renderer.update(visited_nodes)
+    st.pyplot(renderer.figure)
+
+ANIMATION_POLL_SECONDS = 0.5
+
+def play(renderer, frames, speed, as_gif=False, start=0, highlights=False):
+    st.session_state.pop("animation_image", None)
+    st.session_state.playback_fresh = True
+    if "playback" in st.session_state:
+        stop_playback()
+    if isinstance(frames, StepTrace):
+        frames = frames.copy()
+    if as_gif:
+        if isinstance(frames, StepTrace):
+            frames = frames.frames_with_highlights(start) if highlights else frames.frames(start)
+        st.session_state.animation = export_animation_async(renderer, frames, fps=1 / speed)
+        show_animation()
+        return
+    st.session_state.playback = (Player(frames, start, highlights), renderer, speed)
+    show_playback()
+
+@st.fragment(run_every=ANIMATION_POLL_SECONDS)
+def poll_animation():
+    # Re-runs on its own while the export worker renders; a full rerun picks up the result.
+    if st.session_state.animation.done():
+        st.rerun()
+    st.caption("Rendering animation in the background...")
+
+def show_animation():
+    future = st.session_state.get("animation")
+    if future is not None and future.done():
+        del st.session_state.animation
+        try:
+            path = future.result()
+        except (OSError, RuntimeError, ValueError) as e:
+            st.error(f"Animation export failed: {e}")
+            return
+        with open(path, "rb") as f:
+            st.session_state.animation_image = f.read()
+        os.remove(path)
+    if st.session_state.get("animation") is not None:
+        poll_animation()
+    elif "animation_image" in st.session_state:
+        st.image(st.session_state.animation_image)
+
+def stop_playback():
+    st.session_state.pop("playback")[0].close()
+
+def show_playback():
+    playback = st.session_state.get("playback")
+    if playback is None:
+        return
+    player, renderer, speed = playback
+    col1, col2, col3, col4 = st.columns(4)
+    col1.button("Resume" if player.paused else "Pause", on_click=player.toggle, key="playback_toggle")
+    col2.number_input("Step:", min_value=0, step=1, key="playback_step", label_visibility="collapsed")
+    col3.button("Seek", on_click=lambda: player.seek(st.session_state.playback_step), key="playback_seek")
+    col4.button("Stop", on_click=stop_playback, key="playback_stop")
+    placeholder = st.empty()
+    status = st.empty()
+    try:
+        for frame in player.play(speed):
+            apply_frame(renderer, frame)
+            placeholder.pyplot(renderer.figure)
+            status.caption(f"Step {player.position} - {player.skipped} frames skipped")
+    except Exception as e:
+        stop_playback()
+        st.error(f"The algorithm failed during playback: {type(e).__name__}: {e}")
+        return
+    placeholder.pyplot(renderer.figure)
+    total = f" of {len(player) - 1}" if len(player) else ""
+    status.caption(f"Step {player.position}{total} - {player.skipped} frames skipped"
+                   + (" (paused)" if player.paused else ""))
+
+# ----------------- Graph Core -----------------
+
+STORE_DIRECTORY = "data"
+
+@st.cache_resource
+def get_graph_store(app_name, directed):
+    # One store per app and graph type, shared by that app's sessions, so the
+    # two apps and the two graph types never replay each other's mutation logs.
+    return GraphStore(os.path.join(STORE_DIRECTORY, app_name, "directed" if directed else "undirected"))
+
+def store_for(directed):
+    return get_graph_store(st.session_state.app_name, directed)
+
+def graph_changed(*mutation):
+    st.session_state.graph_version = st.session_state.get("graph_version", 0) + 1
+    if mutation:
+        store_for(st.session_state.graph.is_directed()).record(st.session_state.graph, *mutation)
+    sssp = st.session_state.get("sssp")
+    if sssp is not None:
+        if sssp.graph is not st.session_state.graph:
+            st.session_state.sssp = None
+        elif mutation:
+            sssp.apply(*mutation)
+    components = st.session_state.get("components")
+    if components is not None:
+        if components.graph is not st.session_state.graph:
+            st.session_state.components = None
+        elif mutation:
+            components.apply(*mutation)
+
+def load_graph(directed=False):
+    store = store_for(directed)
+    with store.lock:
+        graph = store.load(directed)
+        csr = store.csr
+    st.session_state.graph = graph
+    graph_changed()
+    if csr is not None:
+        st.session_state.csr = csr
+        st.session_state.csr_version = st.session_state.graph_version
+    return graph
+
+def switch_graph_type(directed):
+    # Each graph type has its own store; switching converts the current graph into it.
+    st.session_state.graph = convert_graph(st.session_state.graph, directed)
+    store_for(directed).save(st.session_state.graph)
+    graph_changed()
+    return st.session_state.graph
+
+def get_csr(graph):
+    version = st.session_state.get("graph_version", 0)
+    if st.session_state.get("csr_version") != version:
+        st.session_state.csr = CSRGraph.from_networkx(graph)
+        st.session_state.csr_version = version
+    return st.session_state.csr
+
+def get_layout(graph, method="auto"):
+    if 'layout_cache' not in st.session_state:
+        st.session_state.layout_cache = LayoutCache()
+    if method == "auto":
+        method = default_method(graph)
+    return st.session_state.layout_cache.get(graph, st.session_state.get("graph_version", 0), method)
+
+def cached_search(key, compute):
+    if 'result_cache' not in st.session_state:
+        st.session_state.result_cache = ResultCache()
+    return st.session_state.result_cache.get(st.session_state.get("graph_version", 0), key, compute)
+
+# ----------------- Graph Algorithms -----------------
+
+SEARCH_COLORS = {"BFS": 'orange', "DFS": 'blue', "UCS": 'green', "A*": 'purple'}
+
+def run_search(graph, algorithm, start_node, target, whole_graph, pos, ops=None):
+    csr = None if algorithm == "A*" else get_csr(graph)
+    return algorithms.run_search(graph, algorithm, start_node, target, whole_graph, pos, ops, csr, save_log)
+
+def seed_dynamic_paths(graph, start_node):
+    sssp = st.session_state.get("sssp")
+    if sssp is None or sssp.graph is not graph or sssp.source != start_node:
+        st.session_state.sssp = DynamicSSSP(graph, start_node)
+
+def show_dynamic_paths(graph):
+    sssp = st.session_state.get("sssp")
+    if sssp is None or sssp.graph is not graph or sssp.source not in graph:
+        return
+    st.subheader(f"Maintained shortest paths from '{sssp.source}'")
+    st.caption(f"Updated incrementally on edge edits; last edit touched {sssp.touched} nodes.")
+    target = st.selectbox("Target:", list(graph.nodes), key="dynamic_target")
+    if target in sssp.costs:
+        st.write(f"{' -> '.join(map(str, sssp.path(target)))} (cost {sssp.costs[target]})")
+    else:
+        st.warning(f"'{target}' is not reachable from '{sssp.source}'.")
+
+# ----------------- Graph Analytics -----------------
+
+NODE_COLORINGS = ["None", "Connected components", "Strongly connected components"]
+ORDER_PREVIEW = 50
+
+def get_components(graph):
+    tracker = st.session_state.get("components")
+    if tracker is None or tracker.graph is not graph:
+        tracker = st.session_state.components = ComponentTracker(graph)
+    return tracker
+
+def show_analytics_panel(graph):
+    if graph.number_of_nodes() == 0:
+        return None
+    st.subheader("Graph Analytics")
+    tracker = get_components(graph)
+    csr = get_csr(graph)
+    col1, col2 = st.columns(2)
+    col1.metric("Connected components", tracker.count)
+    colorings = NODE_COLORINGS if graph.is_directed() else NODE_COLORINGS[:2]
+    if graph.is_directed():
+        scc, scc_count = cached_search(("scc",), lambda: graph_analytics.strongly_connected_components(csr))
+        col2.metric("Strongly connected components", scc_count)
+        order, acyclic = cached_search(("topological",), lambda: graph_analytics.topological_sort(csr))
+        if acyclic:
+            labels = csr.to_labels(order[:ORDER_PREVIEW].tolist())
+            st.write("Topological order: " + " -> ".join(map(str, labels)) + (" ..." if len(order) > ORDER_PREVIEW else ""))
+        else:
+            cyclic = cached_search(("cyclic",), lambda: graph_analytics.cyclic_nodes(csr))
+            st.warning(f"No topological order: {len(cyclic)} nodes lie on cycles.")
+    else:
+        col2.metric("Has cycle", "Yes" if cached_search(("cycle",), lambda: graph_analytics.has_cycle(csr)) else "No")
+    coloring = st.selectbox("Color nodes by:", colorings, key="node_coloring")
+    if coloring == "Connected components":
+        return tracker.groups()
+    if coloring == "Strongly connected components":
+        return dict(zip(csr.labels, scc.tolist()))
+    return None
+
+# ----------------- Profiling -----------------
+
+INSTRUMENTED = ["BFS", "DFS", "UCS", "Insertion Sort", "Merge Sort", "Quick Sort", "Selection Sort"]
+
+def new_op_counter(algorithm):
+    if algorithm in INSTRUMENTED and st.session_state.get("profile_ops"):
+        return OpCounter(st.session_state.get("profile_counters", COUNTERS))
+    return None
+
+def record_ops(algorithm, ops):
+    if ops is not None:
+        st.session_state.last_profile = {"algorithm": algorithm, "counts": ops.as_dict()}
+
+def show_profile_panel():
+    with st.sidebar:
+        st.header("Profiling")
+        st.checkbox("Count operations", key="profile_ops")
+        st.multiselect("Counters:", COUNTERS, default=COUNTERS, key="profile_counters")
+        profile = st.session_state.get("last_profile")
+        if profile:
+            st.json(profile)
+            st.download_button("Export JSON", json.dumps(profile, indent=2),
+                               file_name="profile.json", mime="application/json")
+
+# ----------------- Graph Import/Export -----------------
+
+def import_graph(uploaded, directed):
+    if uploaded.name.endswith(".bin"):
+        csr = graph_io.load_binary(uploaded.getvalue())
+    else:
+        csr = graph_io.load_csr(uploaded, directed, graph_io.guess_delimiter(uploaded.name))
+    graph = graph_io.csr_to_networkx(csr)
+    if csr.directed != directed:
+        graph = graph.to_directed() if directed else graph.to_undirected()
+    st.session_state.graph = graph
+    store_for(directed).save(graph)
+    graph_changed()
+    if csr.directed == directed:
+        st.session_state.csr = csr
+        st.session_state.csr_version = st.session_state.graph_version
+    return graph
+
+def export_csv(csr):
+    text = io.StringIO()
+    graph_io.write_edge_list(csr, text)
+    return text.getvalue()
+
+def export_binary(csr):
+    binary = io.BytesIO()
+    graph_io.save_binary(csr, binary)
+    return binary.getvalue()
+
+def show_export_buttons(graph):
+    # Serialized only when a button is clicked (on Streamlit's download thread),
+    # from the CSR snapshot of the current graph version.
+    csr = get_csr(graph)
+    st.download_button("Export CSV", lambda: export_csv(csr), file_name="graph.csv", mime="text/csv")
+    st.download_button("Export Binary", lambda: export_binary(csr), file_name="graph.bin",
+                       mime="application/octet-stream")
+
+# ----------------- Batch Jobs -----------------
+
+def show_batch_search_panel(graph):
+    st.subheader("Batch: distances from many start nodes")
+    sources = st.multiselect("Start nodes (empty = random sample):", list(graph.nodes), key="batch_sources")
+    nodes = graph.number_of_nodes()
+    sample = st.number_input("Sample size:", 1, nodes, min(nodes, batch.SOURCE_SAMPLE), key="batch_sample",
+                             disabled=bool(sources))
+    algorithm = st.selectbox("Batch algorithm:", ["BFS", "UCS"], key="batch_algorithm")
+    workers = st.number_input("Worker processes:", 1, os.cpu_count() or 1, os.cpu_count() or 1, key="batch_workers")
+    if st.button("Run Batch"):
+        csr = get_csr(graph)
+        sources = sources or batch.sample_sources(csr, sample)
+        previous = st.session_state.pop("batch_csv", None)
+        if previous is not None and os.path.exists(previous):
+            os.remove(previous)
+        # Full distance rows stream to a temporary CSV; only the summary stays in memory.
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="", delete=False) as f:
+            st.session_state.batch_csv = path = f.name
+            writer = csv.writer(f)
+            writer.writerow(["source", "reachable", "closeness"] + list(map(str, csr.labels)))
+            progress = st.progress(0.0)
+            summary = []
+            for done, (source, distances) in enumerate(batch.all_sources(csr, algorithm.lower(), sources, workers), 1):
+                row = [source, int(np.isfinite(distances).sum()) - 1, batch.closeness(distances)]
+                writer.writerow(row + distances.tolist())
+                summary.append(dict(zip(("source", "reachable", "closeness"), row)))
+                progress.progress(done / len(sources))
+        summary.sort(key=lambda row: row["closeness"], reverse=True)
+        st.dataframe(summary)
+        st.download_button("Export distances CSV", lambda: read_file(path), file_name="distances.csv", mime="text/csv")
+
+def read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def show_batch_sort_panel():
+    st.subheader("Batch: sort many arrays")
+    count = st.number_input("Number of arrays:", 1, 100, 8, key="batch_count")
+    length = st.number_input("Array length:", 1, 1_000_000, 100_000, key="batch_length")
+    algorithm = st.selectbox("Batch sort:", batch.BATCH_SORTS, key="batch_sort")
+    workers = st.number_input("Worker processes:", 1, os.cpu_count() or 1, os.cpu_count() or 1, key="batch_sort_workers")
+    if st.button("Run Batch Sort"):
+        arrays = [generate_array("random", length, high=1_000_000).tolist() for _ in range(count)]
+        progress = st.progress(0.0)
+        start = time.perf_counter()
+        for done, (index, result) in enumerate(batch.batch_sort(arrays, algorithm, workers), 1):
+            progress.progress(done / count, text=f"array {index} sorted")
+        st.success(f"Sorted {count} arrays of {length} values in {time.perf_counter() - start:.2f} s.")
+
+# ----------------- External Sort -----------------
+
+# Visitors may only read and write files under this directory.
+EXTERNAL_SORT_DIR = os.environ.get("EXTERNAL_SORT_DIR", "external_sort_files")
+
+def show_external_sort_panel():
+    st.subheader("External sort (files larger than memory)")
+    st.caption(f"Paths are relative to the server's {EXTERNAL_SORT_DIR}/ directory.")
+    input_path = st.text_input("Input file:", key="external_input")
+    output_path = st.text_input("Output file:", key="external_output")
+    text = st.checkbox("Text file (whitespace-separated integers)", key="external_text")
+    dtype = st.text_input("Binary dtype:", "<i8", key="external_dtype", disabled=text)
+    memory_mb = st.number_input("Memory budget (MB):", 16, 65536, 256, key="external_memory")
+    engine = st.selectbox("Run engine:", external_sort.ENGINES, key="external_engine")
+    if st.button("Run External Sort") and input_path and output_path:
+        progress = st.progress(0.0)
+        events = []
+        try:
+            source = external_sort.resolve_within(EXTERNAL_SORT_DIR, input_path)
+            target = external_sort.resolve_within(EXTERNAL_SORT_DIR, output_path)
+            for event in external_sort.external_sort_steps(source, target, dtype, text,
+                                                           memory_mb * 1024 * 1024, engine):
+                events.append(event)
+                phase, step, done, total = event
+                if total:
+                    progress.progress(min(done / total, 1.0), text=f"{phase} {step}: {done:,} / {total:,}")
+        except (OSError, ValueError) as e:
+            st.error(f"External sort failed: {e}")
+            return
+        get_trace_logger().submit("external_sort_progress", events)
+        st.success(f"Sorted {events[-1][3]:,} values into {output_path}.")
+
+# ----------------- Array Input -----------------
+
+ARRAY_SOURCES = ["Generate", "Paste", "Upload"]
+
+def get_generated_array(kind, size, seed):
+    # Generated once per (kind, size, seed): every widget interaction reruns
+    # the script, and regenerating up to 10^7 values each time is slow and
+    # swaps the array under the user.
+    key = (kind, size, seed)
+    if st.session_state.get("generated_key") != key:
+        st.session_state.generated_array = generate_array(kind, size, seed).tolist()
+        st.session_state.generated_key = key
+    return st.session_state.generated_array
+
+def array_input(default_source="Generate", default_text="5,3,8,6,2"):
+    source = st.radio("Data source:", ARRAY_SOURCES, index=ARRAY_SOURCES.index(default_source),
+                      horizontal=True, key="array_source")
+    if source == "Generate":
+        kind = st.selectbox("Distribution:", ARRAY_DISTRIBUTIONS, key="array_kind")
+        size = st.number_input("Array size:", 1, 10_000_000, 10, key="array_size")
+        seed = st.number_input("Seed:", 0, 2**32 - 1, 0, key="array_seed")
+        return get_generated_array(kind, size, seed)
+    try:
+        if source == "Paste":
+            text = st.text_area("Numbers (comma, space or newline separated):", default_text, key="array_text")
+            values, bad = parse_numbers(text)
+        else:
+            uploaded = st.file_uploader("CSV / text, raw int64 binary (.bin) or .npy",
+                                        type=["csv", "txt", "bin", "dat", "raw", "npy"], key="array_file")
+            if uploaded is None:
+                return []
+            values, bad = load_array(uploaded.getvalue(), uploaded.name)
+    except ValueError as e:
+        st.error(f"Could not read the array: {e}")
+        return []
+    if bad:
+        st.warning(f"Skipped {len(bad)} invalid tokens: "
+                   + ", ".join(f"'{token}'" if position is None else f"#{position} '{token}'" for position, token in bad[:10]))
+    return values.tolist()
+
+# ----------------- Tabs -----------------
+
+SORTS = {
+    "Auto (counting / radix for integers)": lambda arr, ops: algorithms.auto_sort(arr, log=save_log),
+    "Insertion Sort": lambda arr, ops: algorithms.insertion_sort(arr, ops, log=save_log),
+    "Merge Sort": lambda arr, ops: algorithms.merge_sort(arr, ops, log=save_log),
+    "Merge Sort (Natural runs)": lambda arr, ops: algorithms.natural_merge_sort(arr, log=save_log),
+    "Quick Sort": lambda arr, ops: algorithms.quick_sort(arr, ops, log=save_log),
+    "Quick Sort (Introsort)": lambda arr, ops: algorithms.introsort(arr, log=save_log),
+    "Selection Sort": lambda arr, ops: algorithms.selection_sort(arr, ops, log=save_log),
+    "Counting Sort": lambda arr, ops: algorithms.counting_sort(arr, log=save_log),
+    "Radix Sort (LSD)": lambda arr, ops: algorithms.radix_sort(arr, log=save_log),
+}
+# Sorts whose traces mark the compared/swapped cells of each step.
+HIGHLIGHTED_SORTS = ["Insertion Sort", "Selection Sort"]
+
+def graph_management_tab(graph, app):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Add Node")
+        with st.form("Add Node Form"):
+            node_name = st.text_input("Node name")
+            submitted_node = st.form_submit_button("Add Node")
+            if submitted_node:
+                if node_name:
+                    if node_name in graph.nodes:
+                        st.warning(f"Node '{node_name}' already exists!")
+                    else:
+                        graph.add_node(node_name)
+                        graph_changed("add_node", node_name)
+                        st.success(f"Node '{node_name}' added.")
+                else:
+                    st.error("Please enter a node name.")
+
+        st.subheader("Remove Node")
+        if graph.number_of_nodes() > 0:
+            with st.form("Remove Node Form"):
+                node_to_remove = st.selectbox("Select node to remove", list(graph.nodes))
+                submitted_remove_node = st.form_submit_button("Remove Node")
+                if submitted_remove_node:
+                    graph.remove_node(node_to_remove)
+                    graph_changed("remove_node", node_to_remove)
+                    st.success(f"Node '{node_to_remove}' removed.")
+        else:
+            st.info("No nodes to remove.")
+
+    with col2:
+        st.subheader("Add Edge")
+        if graph.number_of_nodes() >= 2:
+            with st.form("Add Edge Form"):
+                node1 = st.selectbox("Node 1", list(graph.nodes), key="node1")
+                node2 = st.selectbox("Node 2", list(graph.nodes), key="node2")
+                weight = st.number_input("Weight (default = 1)", min_value=1, value=1)
+                submitted_edge = st.form_submit_button("Add Edge")
+                if submitted_edge:
+                    if node1 == node2:
+                        st.error("Cannot connect a node to itself.")
+                    elif graph.has_edge(node1, node2):
+                        st.warning(f"Edge from '{node1}' to '{node2}' already exists.")
+                    else:
+                        graph.add_edge(node1, node2, weight=weight)
+                        graph_changed("add_edge", node1, node2, weight)
+                        st.success(f"Edge added from '{node1}' to '{node2}' with weight {weight}.")
+        else:
+            st.info("Add at least two nodes to add edges.")
+
+        st.subheader("Remove Edge")
+        if graph.number_of_edges() > 0:
+            with st.form("Remove Edge Form"):
+                edge_to_remove = st.selectbox("Select edge to remove", list(graph.edges))
+                submitted_remove_edge = st.form_submit_button("Remove Edge")
+                if submitted_remove_edge:
+                    graph.remove_edge(*edge_to_remove)
+                    graph_changed("remove_edge", *edge_to_remove)
+                    st.success(f"Edge {edge_to_remove} removed.")
+        else:
+            st.info("No edges to remove.")
+
+    st.subheader("Import / Export")
+    with st.form("Import Graph Form"):
+        uploaded = st.file_uploader("Edge list (.txt, .edges), CSV or binary (.bin)", type=["txt", "edges", "csv", "bin"])
+        submitted_import = st.form_submit_button("Import Graph")
+        if submitted_import and uploaded is not None:
+            try:
+                graph = import_graph(uploaded, graph.is_directed())
+                st.success(f"Imported {graph.number_of_nodes()} nodes and {graph.number_of_edges()} edges.")
+            except ValueError as e:
+                st.error(f"Could not import graph: {e}")
+    if graph.number_of_nodes() > 0:
+        show_export_buttons(graph)
+
+    if graph.number_of_nodes() > 0:
+        groups = show_analytics_panel(graph)
+        draw_graph(app, graph, [], get_layout(graph, app["layout"]), groups=groups)
+    else:
+        st.info("Add nodes to display the graph.")
+
+def graph_algorithms_tab(graph, app):
+    if graph.number_of_nodes() == 0:
+        st.info("Add nodes to run algorithms.")
+        return
+    start_node = st.selectbox("Start node:", list(graph.nodes), key="startnode")
+    algorithm = st.selectbox("Choose algorithm:", ["BFS", "DFS", "UCS", "A*"])
+    whole_graph = algorithm == "DFS" and st.checkbox("Continue into unreachable components (DFS forest)")
+    target = None
+    if algorithm in ("UCS", "A*"):
+        targets = list(graph.nodes) if algorithm == "A*" else [None] + list(graph.nodes)
+        # UCS may leave its target on "(explore whole graph)"; A* must not inherit that.
+        target = st.selectbox("Target node:", targets, key=f"targetnode_{algorithm}",
+                              format_func=lambda node: "(explore whole graph)" if node is None else str(node))
+    speed = st.slider("Animation speed (seconds):", 0.1, 2.0, 0.7, 0.1)
+    as_gif = st.checkbox("Pre-render as GIF", key="graph_gif")
+
+    if st.button("Start Search"):
+        pos = get_layout(graph, app["layout"])
+        ops = new_op_counter(algorithm)
+        if ops is None:
+            key = (algorithm, start_node, target, whole_graph, app["layout"])
+            steps, path, cost = cached_search(
+                key, lambda: run_search(graph, algorithm, start_node, target, whole_graph, pos))
+        else:
+            steps, path, cost = run_search(graph, algorithm, start_node, target, whole_graph, pos, ops)
+
+        renderer = app["graph_renderer"](graph, pos, app["zoom"], app["search_colors"][algorithm], graph.is_directed())
+        play(renderer, steps, speed, as_gif, start=1)
+        record_ops(algorithm, ops)
+        if algorithm == "UCS":
+            seed_dynamic_paths(graph, start_node)
+
+        if target is not None:
+            if path:
+                st.success(f"Shortest path: {' -> '.join(map(str, path))} (cost {cost})")
+                draw_graph(app, graph, path, pos, app["path_color"])
+            else:
+                st.warning(f"'{target}' is not reachable from '{start_node}'.")
+
+    show_dynamic_paths(graph)
+    show_batch_search_panel(graph)
+
+def sorting_tab(app):
+    sort_algo = st.selectbox("Choose sorting algorithm:", list(SORTS))
+    speed = st.slider("Animation speed (seconds):", 0.1, 1.0, 0.5, 0.1, key="sort_speed")
+    as_gif = st.checkbox("Pre-render as GIF", key="sort_gif")
+    array_view = st.selectbox("Large-array view:", ARRAY_VIEWS, key="array_view")
+    data = array_input(app["array_source"])
+
+    if st.button("Start Sorting") and data:
+        ops = new_op_counter(sort_algo)
+        steps = SORTS[sort_algo](data[:], ops)
+        play(make_array_renderer(data, app["array_kind"], mode=array_view), steps, speed, as_gif,
+             highlights=sort_algo in HIGHLIGHTED_SORTS)
+        record_ops(sort_algo, ops)
+
+    show_batch_sort_panel()
+    show_external_sort_panel()
+
+# ----------------- App -----------------
+
+def default_graph_renderer(graph, pos, zoom, color, directed, groups=None):
+    return make_graph_renderer(graph, pos, zoom, color, directed, groups=groups)
+
+def run_app(title, graph_renderer=default_graph_renderer, search_colors=SEARCH_COLORS, path_color='red',
+            array_kind="bars", array_source="Generate", directed=None, name="app"):
+    # directed=None lets the user switch the graph type; True/False pins it.
+    # name keys the app's graph stores under data/.
+    st.title(title)
+    st.session_state.app_name = name
+
+    if 'graph' not in st.session_state:
+        st.session_state.directed = load_graph(bool(directed)).is_directed()
+    if 'graph_type' not in st.session_state:
+        st.session_state.graph_type = "Directed" if st.session_state.directed else "Undirected"
+
+    with st.sidebar:
+        st.header("Graph Settings")
+        if directed is None:
+            directed = st.radio("Graph Type:", ["Undirected", "Directed"], key="graph_type") == "Directed"
+        zoom = st.slider("Zoom level:", 0.5, 3.0, 1.5, 0.1)
+        layout_method = st.selectbox("Layout:", ["auto"] + LAYOUT_METHODS)
+
+    if st.session_state.graph.is_directed() != directed:
+        switch_graph_type(directed)
+    st.session_state.directed = directed
+
+    graph = st.session_state.graph
+    app = {"graph_renderer": graph_renderer, "search_colors": search_colors, "path_color": path_color,
+           "array_kind": array_kind, "array_source": array_source, "zoom": zoom, "layout": layout_method}
+
+    tab1, tab2, tab3 = st.tabs(["Graph Management", "Graph Algorithms", "Sorting Visualizer"])
+    with tab1:
+        st.header("Graph Management")
+        graph_management_tab(graph, app)
+    with tab2:
+        st.header("Graph Algorithms")
+        graph_algorithms_tab(graph, app)
+    with tab3:
+        st.header("Sorting Visualizer")
+        sorting_tab(app)
+
+    if not st.session_state.pop("playback_fresh", False):
+        show_playback()
+        show_animation()
+    show_profile_panel()
@@ -0,0 +1,104 @@
+# Bulk array ingestion: vectorized text parsing, raw binary / .npy loading and large test arrays
+
+import io
+import os
+
+import numpy as np
+
+ARRAY_DISTRIBUTIONS = ["random", "sorted", "reversed", "few_unique", "zipf"]
+BINARY_EXTENSIONS = (".bin", ".dat", ".raw")
+MAX_REPORTED = 100
+
+# ----------------- Text Parsing -----------------
+
+def tokenize(data):
+    if isinstance(data, str):
+        data = data.encode()
+    return bytes(data).replace(b",", b" ").replace(b";", b" ").split()
+
+def parse_numbers(data, dtype=np.int64, max_reported=MAX_REPORTED):
+    # Returns (values, bad) where bad lists (position, token) for the first
+    # max_reported tokens that are not numbers; positions count from 1.
+    tokens = np.array(tokenize(data), dtype=bytes)
+    if tokens.size == 0:
+        return np.zeros(0, dtype), []
+    dtype = np.dtype(dtype)
+    try:
+        return tokens.astype(dtype), []
+    except (ValueError, OverflowError):
+        pass
+    valid = _valid_tokens(tokens, dtype)
+    bad_positions = np.flatnonzero(~valid)
+    bad = [(int(i) + 1, tokens[i].decode(errors="replace")) for i in bad_positions[:max_reported]]
+    if len(bad_positions) > max_reported:
+        bad.append((None, f"... {len(bad_positions) - max_reported} more"))
+    return tokens[valid].astype(dtype), bad
+
+def _valid_tokens(tokens, dtype):
+    if dtype.kind in "iu":
+        digits = np.char.lstrip(tokens, b"+-") if dtype.kind == "i" else tokens
+        signs = np.char.str_len(tokens) - np.char.str_len(digits)
+        valid = np.char.isdigit(digits) & (signs <= 1)
+        # Anything longer than the type's digit count may overflow; check those exactly.
+        info = np.iinfo(dtype)
+        for i in np.flatnonzero(valid & (np.char.str_len(digits) >= len(str(info.max)))):
+            valid[i] = info.min <= int(tokens[i]) <= info.max
+        return valid
+    # Floats have too many spellings to validate with string ops; only the
+    # failing chunk pays for the per-token fallback.
+    valid = np.ones(len(tokens), dtype=bool)
+    for i, token in enumerate(tokens.tolist()):
+        try:
+            float(token)
+        except ValueError:
+            valid[i] = False
+    return valid
+
+# ----------------- Binary Loading -----------------
+
+def _is_binary(name):
+    return name.lower().endswith(BINARY_EXTENSIONS)
+
+def load_array(source, name=None, dtype="<i8"):
+    # source is a file path (memory-mapped for binary formats) or raw bytes
+    # (e.g. an upload, viewed in place). Returns (values, bad) like parse_numbers.
+    if isinstance(source, str):
+        name = name or source
+        if name.lower().endswith(".npy"):
+            return np.load(source, mmap_mode="r"), []
+        if _is_binary(name):
+            itemsize = np.dtype(dtype).itemsize
+            count = os.path.getsize(source) // itemsize
+            values = np.memmap(source, dtype=dtype, mode="r", shape=(count,)) if count else np.zeros(0, dtype)
+            return values, _trailing(os.path.getsize(source), itemsize, count)
+        with open(source, "rb") as f:
+            return parse_numbers(f.read(), np.dtype(dtype).newbyteorder("="))
+    name = name or ""
+    if name.lower().endswith(".npy"):
+        return np.load(io.BytesIO(source)), []
+    if _is_binary(name):
+        itemsize = np.dtype(dtype).itemsize
+        count = len(source) // itemsize
+        return np.frombuffer(source, dtype=dtype, count=count), _trailing(len(source), itemsize, count)
+    return parse_numbers(source, np.dtype(dtype).newbyteorder("="))
+
+def _trailing(size, itemsize, count):
+    extra = size - count * itemsize
+    return [(count + 1, f"{extra} trailing bytes")] if extra else []
+
+# ----------------- Generators -----------------
+
+def generate_array(kind, size, seed=None, high=None, unique=8, zipf_a=1.5):
+    rng = np.random.default_rng(seed)
+    high = high or max(100, size)
+    if kind == "random":
+        return rng.integers(1, high + 1, size)
+    if kind == "sorted":
+        return np.sort(rng.integers(1, high + 1, size))
+    if kind == "reversed":
+        return np.sort(rng.integers(1, high + 1, size))[::-1].copy()
+    if kind == "few_unique":
+        return rng.integers(1, unique + 1, size)
+    if kind == "zipf":
+        return np.minimum(rng.zipf(zipf_a, size), high)
+    raise ValueError(f"unknown array distribution: {kind}")
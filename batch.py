@@ -0,0 +1,141 @@
+# Process-pool batch jobs: all-sources BFS/UCS over a shared-memory CSR graph and multi-array sorts
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import sorting
+from csr_graph import CSRGraph, csr_bfs, csr_dijkstra
+
+BATCH_SEARCHES = ["bfs", "ucs"]
+
+BATCH_SORTS = ["merge", "introsort", "auto"]
+
+SOURCES_PER_TASK = 16
+
+# All-sources output is O(n) per source; default to a sample of start nodes.
+SOURCE_SAMPLE = 100
+
+# ----------------- Shared Graph -----------------
+
+class SharedCSR:
+    # Copies the CSR arrays into shared memory once; workers map them by name
+    # instead of receiving a pickled copy of the graph with every task.
+    def __init__(self, csr):
+        self.blocks = []
+        self.descriptor = {"directed": csr.directed, "arrays": {}}
+        for name in ("offsets", "targets", "weights"):
+            array = np.ascontiguousarray(getattr(csr, name))
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, array.dtype, buffer=block.buf)[:] = array
+            self.blocks.append(block)
+            self.descriptor["arrays"][name] = (block.name, array.shape, array.dtype.str)
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def attach_csr(descriptor):
+    blocks = []
+    arrays = {}
+    for name, (block_name, shape, dtype) in descriptor["arrays"].items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype, buffer=block.buf)
+    n = len(arrays["offsets"]) - 1
+    csr = CSRGraph(range(n), arrays["offsets"], arrays["targets"], arrays["weights"], descriptor["directed"])
+    return csr, blocks
+
+# ----------------- Worker Side -----------------
+
+_worker = {}
+
+def _attach_worker(descriptor):
+    _worker["csr"], _worker["blocks"] = attach_csr(descriptor)
+
+def source_distances(csr, source, algorithm):
+    if algorithm == "bfs":
+        levels = csr_bfs(csr, source)[1].astype(np.float64)
+        levels[levels < 0] = np.inf
+        return levels
+    costs = csr_dijkstra(csr, source)[1]
+    distances = np.full(csr.number_of_nodes(), np.inf)
+    distances[np.fromiter(costs.keys(), dtype=np.int64, count=len(costs))] = list(costs.values())
+    return distances
+
+def _search_task(sources, algorithm):
+    csr = _worker["csr"]
+    return [(source, source_distances(csr, source, algorithm)) for source in sources]
+
+def sort_one(arr, algorithm):
+    if algorithm == "auto":
+        import integer_sorts
+        return integer_sorts.auto_sort(arr)
+    if algorithm == "introsort":
+        deque(sorting.introsort(arr), maxlen=0)
+        return arr
+    return sorting.buffered_merge_sort(arr)
+
+def _sort_task(index, arr, algorithm):
+    return index, sort_one(arr, algorithm)
+
+# ----------------- Batch API -----------------
+
+def all_sources(csr, algorithm="bfs", sources=None, workers=None, per_task=SOURCES_PER_TASK):
+    # Yields (source_label, distances) as results complete; distances are indexed
+    # by node id (csr.labels order) with inf for unreachable nodes.
+    if algorithm not in BATCH_SEARCHES:
+        raise ValueError(f"unknown batch search: {algorithm}")
+    ids = list(range(csr.number_of_nodes())) if sources is None else [csr.ids[s] for s in sources]
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(ids) <= per_task:
+        for source in ids:
+            yield csr.labels[source], source_distances(csr, source, algorithm)
+        return
+    with SharedCSR(csr) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_worker,
+                                 initargs=(shared.descriptor,)) as pool:
+            futures = [pool.submit(_search_task, ids[i:i + per_task], algorithm)
+                       for i in range(0, len(ids), per_task)]
+            for future in as_completed(futures):
+                for source, distances in future.result():
+                    yield csr.labels[source], distances
+
+def batch_sort(arrays, algorithm="merge", workers=None):
+    # Yields (index, sorted array) in completion order.
+    if algorithm not in BATCH_SORTS:
+        raise ValueError(f"unknown batch sort: {algorithm}")
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(arrays) < 2:
+        for index, arr in enumerate(arrays):
+            yield index, sort_one(arr, algorithm)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_sort_task, index, arr, algorithm) for index, arr in enumerate(arrays)]
+        for future in as_completed(futures):
+            yield future.result()
+
+def sample_sources(csr, size=SOURCE_SAMPLE, seed=None):
+    n = csr.number_of_nodes()
+    if size >= n:
+        return list(csr.labels)
+    picked = np.sort(np.random.default_rng(seed).choice(n, size, replace=False))
+    return csr.to_labels(picked.tolist())
+
+def closeness(distances):
+    n = len(distances)
+    reachable = distances[np.isfinite(distances) & (distances > 0)]
+    if n < 2 or len(reachable) == 0:
+        return 0.0
+    return (len(reachable) / reachable.sum()) * (len(reachable) / (n - 1))
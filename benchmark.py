@@ -0,0 +1,250 @@
+# Headless benchmark runner for the graph and sorting algorithms
+#
+#   python benchmark.py --sizes 500 1000 2000 --output bench.json
+#   python benchmark.py --baseline bench.json --threshold 1.25
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter, deque
+
+import integer_sorts
+import sorting
+from counters import GRAPH_COUNTERS, SORT_COUNTERS, OpCounter
+from step_trace import StepTrace
+
+SORT_ALGORITHMS = {
+    "insertion_sort": lambda arr, trace: sorting.insertion_sort(arr, trace),
+    "selection_sort": lambda arr, trace: sorting.selection_sort(arr, trace),
+    "merge_sort": lambda arr, trace: deque(sorting.merge_sort(arr, trace), maxlen=0),
+    "quick_sort": lambda arr, trace: deque(sorting.quick_sort(arr, trace), maxlen=0),
+    "introsort": lambda arr, trace: deque(sorting.introsort(arr, trace), maxlen=0),
+    "natural_merge_sort": lambda arr, trace: run_merge_engine(arr, trace, "natural"),
+    "bottom_up_merge_sort": lambda arr, trace: run_merge_engine(arr, trace, "bottom_up"),
+    "counting_sort": lambda arr, trace: run_integer_sort(arr, trace, "counting"),
+    "radix_sort": lambda arr, trace: run_integer_sort(arr, trace, "radix"),
+    "auto_sort": lambda arr, trace: run_integer_sort(arr, trace, "auto"),
+}
+
+def run_merge_engine(arr, trace, strategy):
+    if trace is None:
+        return sorting.buffered_merge_sort(arr, strategy)
+    return deque(sorting.buffered_merge_sort(arr, strategy, trace=trace), maxlen=0)
+
+def run_integer_sort(arr, trace, kind):
+    if trace is not None:
+        steps = {"counting": integer_sorts.counting_sort_steps, "radix": integer_sorts.radix_sort_steps,
+                 "auto": integer_sorts.auto_sort_steps}[kind]
+        return deque(steps(arr, trace), maxlen=0)
+    sort = {"counting": integer_sorts.counting_sort, "radix": integer_sorts.radix_sort}.get(kind)
+    arr[:] = integer_sorts.auto_sort(arr) if sort is None else sort(arr).tolist()
+    return arr
+
+COUNTED_SORTS = {
+    "insertion_sort": lambda arr, ops: sorting.insertion_sort(arr, None, ops),
+    "selection_sort": lambda arr, ops: sorting.selection_sort(arr, None, ops),
+    "merge_sort": lambda arr, ops: deque(sorting.merge_sort(arr, None, ops), maxlen=0),
+    "quick_sort": lambda arr, ops: deque(sorting.quick_sort(arr, None, ops), maxlen=0),
+}
+
+GRAPH_ALGORITHMS = ["bfs", "dfs", "ucs"]
+
+ARRAY_WORKLOADS = ["random", "sorted", "reversed", "few_unique"]
+
+GRAPH_WORKLOADS = ["erdos_renyi", "grid", "scale_free"]
+
+IMPORT_MODULES = ["algorithms", "sorting", "step_trace", "csr_graph", "renderer"]
+
+# ----------------- Workload Generators -----------------
+
+def make_array(kind, size, seed=42):
+    rng = random.Random(seed)
+    if kind == "random":
+        return [rng.randint(1, size) for _ in range(size)]
+    if kind == "sorted":
+        return list(range(size))
+    if kind == "reversed":
+        return list(range(size, 0, -1))
+    if kind == "few_unique":
+        return [rng.randint(1, 8) for _ in range(size)]
+    raise ValueError(f"unknown array workload: {kind}")
+
+def make_graph(kind, size, seed=42):
+    import networkx as nx
+    if kind == "erdos_renyi":
+        graph = nx.fast_gnp_random_graph(size, min(1.0, 8 / max(size, 1)), seed=seed)
+    elif kind == "grid":
+        side = max(1, int(size ** 0.5))
+        graph = nx.convert_node_labels_to_integers(nx.grid_2d_graph(side, side))
+    elif kind == "scale_free":
+        graph = nx.barabasi_albert_graph(size, min(3, size - 1), seed=seed)
+    else:
+        raise ValueError(f"unknown graph workload: {kind}")
+    rng = random.Random(seed)
+    for u, v in graph.edges:
+        graph[u][v]['weight'] = rng.randint(1, 10)
+    return graph
+
+# ----------------- Measurement -----------------
+
+def measure(run, prepare, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        args = prepare()
+        start = time.perf_counter()
+        run(*args)
+        best = min(best, time.perf_counter() - start)
+
+    args = prepare()
+    tracemalloc.start()
+    try:
+        run(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def bench_sort(name, kind, size, repeat):
+    algorithm = SORT_ALGORITHMS[name]
+    data = make_array(kind, size)
+    wall, peak = measure(lambda arr: algorithm(arr, None), lambda: (data[:],), repeat)
+    trace = StepTrace()
+    arr = data[:]
+    algorithm(arr, trace)
+    if arr != sorted(data):
+        raise AssertionError(f"{name} produced an unsorted result")
+    counts = {"events": dict(Counter(event[0] for event in trace.events))}
+    if name in COUNTED_SORTS:
+        ops = OpCounter(SORT_COUNTERS)
+        COUNTED_SORTS[name](data[:], ops)
+        counts.update(ops.as_dict())
+    return wall, peak, counts
+
+def bench_graph(name, kind, size, repeat):
+    from csr_graph import CSRGraph, csr_bfs, csr_dfs, csr_dijkstra
+    csr = CSRGraph.from_networkx(make_graph(kind, size))
+    run = {"bfs": csr_bfs, "dfs": csr_dfs, "ucs": csr_dijkstra}[name]
+    wall, peak = measure(lambda: run(csr, 0), lambda: (), repeat)
+    ops = OpCounter(GRAPH_COUNTERS)
+    order = run(csr, 0, ops=ops)[0]
+    counts = {"nodes": csr.number_of_nodes(), "edges": csr.number_of_edges(), "visited": len(order)}
+    counts.update(ops.as_dict())
+    return wall, peak, counts
+
+IMPORT_PROBE = "import time; t = time.perf_counter(); import {}; print(time.perf_counter() - t)"
+
+def bench_import(module, repeat):
+    # Fresh interpreter per run so nothing is already in sys.modules.
+    here = os.path.dirname(os.path.abspath(__file__))
+    best = float("inf")
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", IMPORT_PROBE.format(module)], cwd=here,
+                             capture_output=True, text=True, check=True).stdout
+        best = min(best, float(out))
+    return best
+
+def run_suite(sizes, graph_sizes, algorithms, repeat, imports=()):
+    results = []
+    for module in imports:
+        result = {"algorithm": "import", "workload": module, "size": 0}
+        try:
+            result["time_s"] = bench_import(module, repeat)
+            result["peak_bytes"] = 0
+        except subprocess.CalledProcessError as e:
+            result["error"] = f"ImportError: {e.stderr.strip().splitlines()[-1]}"
+        results.append(result)
+        print(format_result(result), file=sys.stderr)
+    cases = []
+    for name in algorithms:
+        if name in SORT_ALGORITHMS:
+            cases += [(name, kind, size, bench_sort) for kind in ARRAY_WORKLOADS for size in sizes]
+        elif name in GRAPH_ALGORITHMS:
+            cases += [(name, kind, size, bench_graph) for kind in GRAPH_WORKLOADS for size in graph_sizes]
+        else:
+            raise ValueError(f"unknown algorithm: {name}")
+    for name, kind, size, bench in cases:
+        result = {"algorithm": name, "workload": kind, "size": size}
+        try:
+            wall, peak, ops = bench(name, kind, size, repeat)
+            result.update(time_s=wall, peak_bytes=peak, ops=ops)
+        except (RecursionError, AssertionError) as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        results.append(result)
+        print(format_result(result), file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def format_result(result):
+    label = f"{result['algorithm']:<22} {result['workload']:<12} {result['size']:>8}"
+    if "error" in result:
+        return f"{label}  {result['error']}"
+    return f"{label}  {result['time_s'] * 1000:10.2f} ms  {result['peak_bytes'] / 1024:10.1f} KiB"
+
+# ----------------- Baseline Comparison -----------------
+
+def result_key(result):
+    return result["algorithm"], result["workload"], result["size"]
+
+def compare(report, baseline, threshold):
+    previous = {result_key(r): r for r in baseline["results"] if "time_s" in r}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        if "error" in result:
+            regressions.append({"key": result_key(result), "error": result["error"]})
+            continue
+        ratio = result["time_s"] / old["time_s"] if old["time_s"] > 0 else 1.0
+        result["baseline_ratio"] = ratio
+        if ratio > threshold:
+            regressions.append({"key": result_key(result), "ratio": ratio})
+    return regressions
+
+# ----------------- Command Line -----------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the graph and sorting algorithms.")
+    parser.add_argument("--algorithms", nargs="+", default=list(SORT_ALGORITHMS) + GRAPH_ALGORITHMS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[250, 500, 1000])
+    parser.add_argument("--graph-sizes", nargs="+", type=int, default=[1000, 10000, 100000])
+    parser.add_argument("--imports", nargs="*", default=IMPORT_MODULES, help="modules whose import time is measured")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="compare against a previous JSON report")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio flagged as a regression")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.graph_sizes, args.algorithms, args.repeat, args.imports)
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        status = 1 if regressions else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# Low-overhead operation counters; algorithms take ops=None to skip counting entirely
+
+import json
+
+SORT_COUNTERS = ["comparisons", "swaps", "writes"]
+GRAPH_COUNTERS = ["expansions", "relaxations", "pushes", "pops"]
+COUNTERS = SORT_COUNTERS + GRAPH_COUNTERS
+
+class OpCounter:
+    __slots__ = ["enabled"] + COUNTERS
+
+    def __init__(self, enabled=None):
+        enabled = set(COUNTERS if enabled is None else enabled)
+        unknown = enabled - set(COUNTERS)
+        if unknown:
+            raise ValueError(f"unknown counters: {sorted(unknown)}")
+        self.enabled = enabled
+        for name in COUNTERS:
+            setattr(self, name, 0)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in COUNTERS if name in self.enabled}
+
+    def to_json(self, **meta):
+        return json.dumps({**meta, "counts": self.as_dict()}, indent=2)
+
+def active(ops, *names):
+    # Per-counter flags for algorithms to hoist out of their loops, so a
+    # disabled counter costs one local boolean test and no attribute update.
+    if ops is None:
+        return (False,) * len(names)
+    return tuple(name in ops.enabled for name in names)
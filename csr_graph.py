@@ -0,0 +1,220 @@
+# Compact CSR (compressed sparse row) graph core: the BFS, DFS and Dijkstra engines behind algorithms.py
+
+import heapq
+import numpy as np
+
+from counters import active
+
+# ----------------- CSR Graph -----------------
+
+class CSRGraph:
+    def __init__(self, labels, offsets, targets, weights, directed):
+        self.labels = list(labels)
+        self.ids = {label: i for i, label in enumerate(self.labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_networkx(cls, graph):
+        labels = list(graph.nodes)
+        ids = {label: i for i, label in enumerate(labels)}
+        offsets = np.zeros(len(labels) + 1, dtype=np.int64)
+        targets = []
+        weights = []
+        for i, (node, neighbors) in enumerate(graph.adjacency()):
+            for neighbor, data in neighbors.items():
+                targets.append(ids[neighbor])
+                weights.append(data.get('weight', 1))
+            offsets[i + 1] = len(targets)
+        return cls(labels, offsets, np.asarray(targets, dtype=np.int64),
+                   np.asarray(weights if weights else [], dtype=_weight_dtype(weights)),
+                   graph.is_directed())
+
+    @classmethod
+    def from_arrays(cls, num_nodes, sources, targets, weights=None, directed=False, labels=None):
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(sources), dtype=np.int64)
+        weights = np.asarray(weights)
+        if not directed:
+            sources, targets = np.minimum(sources, targets), np.maximum(sources, targets)
+        sources, targets, weights = _unique_edges(num_nodes, sources, targets, weights)
+        if not directed:
+            # Mirror every edge except self-loops, which networkx also stores once.
+            mirror = sources != targets
+            sources, targets = np.concatenate([sources, targets[mirror]]), np.concatenate([targets, sources[mirror]])
+            weights = np.concatenate([weights, weights[mirror]])
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=num_nodes)
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        if labels is None:
+            labels = range(num_nodes)
+        return cls(labels, offsets, targets[order], weights[order], directed)
+
+    def number_of_nodes(self):
+        return len(self.labels)
+
+    def number_of_edges(self):
+        edges = len(self.targets)
+        if self.directed:
+            return edges
+        # Undirected edges are stored in both rows, self-loops only once.
+        sources = np.repeat(np.arange(self.number_of_nodes()), np.diff(self.offsets))
+        return (edges + int(np.count_nonzero(sources == self.targets))) // 2
+
+    def neighbors(self, node_id):
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def to_labels(self, node_ids):
+        labels = self.labels
+        return [labels[i] for i in node_ids]
+
+def _unique_edges(num_nodes, sources, targets, weights):
+    # Collapse repeated edges the way networkx does: the first occurrence keeps
+    # its position, the last one supplies the weight.
+    keys = sources * max(num_nodes, 1) + targets
+    _, first = np.unique(keys, return_index=True)
+    _, last_reversed = np.unique(keys[::-1], return_index=True)
+    last = len(keys) - 1 - last_reversed
+    order = np.argsort(first, kind='stable')
+    return sources[first[order]], targets[first[order]], weights[last[order]]
+
+def _weight_dtype(weights):
+    if all(isinstance(w, (int, np.integer)) for w in weights):
+        return np.int64
+    return np.float64
+
+# ----------------- Traversals -----------------
+
+def csr_bfs(csr, source, ops=None):
+    n = csr.number_of_nodes()
+    levels = np.full(n, -1, dtype=np.int64)
+    parents = np.full(n, -1, dtype=np.int64)
+    levels[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    chunks = [frontier]
+    level = 0
+    count_expansions, count_relaxations = active(ops, "expansions", "relaxations")
+    while len(frontier):
+        level += 1
+        starts = csr.offsets[frontier]
+        counts = csr.offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if count_expansions:
+            ops.expansions += len(frontier)
+        if count_relaxations:
+            ops.relaxations += total
+        if total == 0:
+            break
+        # Gather every neighbor of the frontier in adjacency order.
+        owners = np.repeat(np.arange(len(frontier)), counts)
+        firsts = np.cumsum(counts) - counts
+        positions = np.repeat(starts, counts) + np.arange(total) - np.repeat(firsts, counts)
+        candidates = csr.targets[positions]
+        fresh = levels[candidates] == -1
+        candidates, owners = candidates[fresh], owners[fresh]
+        # Keep the first occurrence of each node, which matches a queue-based BFS order.
+        _, first = np.unique(candidates, return_index=True)
+        first.sort()
+        frontier = candidates[first]
+        levels[frontier] = level
+        parents[frontier] = chunks[-1][owners[first]]
+        chunks.append(frontier)
+    return np.concatenate(chunks), levels, parents
+
+def csr_dfs(csr, source, whole_graph=False, ops=None):
+    n = csr.number_of_nodes()
+    offsets, targets = csr.offsets, csr.targets
+    discovery = [-1] * n
+    finish = [-1] * n
+    parents = [-1] * n
+    order = []
+    clock = 0
+    roots = [source] + (list(range(n)) if whole_graph else [])
+    count_expansions, count_relaxations, count_pushes, count_pops = active(
+        ops, "expansions", "relaxations", "pushes", "pops")
+    for root in roots:
+        if discovery[root] != -1:
+            continue
+        discovery[root] = clock
+        clock += 1
+        order.append(root)
+        if count_expansions:
+            ops.expansions += 1
+        if count_pushes:
+            ops.pushes += 1
+        stack = [(root, iter(targets[offsets[root]:offsets[root + 1]].tolist()))]
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if count_relaxations:
+                    ops.relaxations += 1
+                if discovery[neighbor] == -1:
+                    discovery[neighbor] = clock
+                    clock += 1
+                    parents[neighbor] = node
+                    order.append(neighbor)
+                    if count_expansions:
+                        ops.expansions += 1
+                    if count_pushes:
+                        ops.pushes += 1
+                    stack.append((neighbor, iter(targets[offsets[neighbor]:offsets[neighbor + 1]].tolist())))
+                    break
+            else:
+                stack.pop()
+                if count_pops:
+                    ops.pops += 1
+                finish[node] = clock
+                clock += 1
+    return order, np.array(discovery), np.array(finish), np.array(parents)
+
+def csr_dijkstra(csr, source, target=None, ops=None):
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    queue = [(0, source)]
+    costs = {source: 0}
+    parents = {source: -1}
+    settled = set()
+    order = []
+    count_expansions, count_relaxations, count_pushes, count_pops = active(
+        ops, "expansions", "relaxations", "pushes", "pops")
+    if count_pushes:
+        ops.pushes += 1
+    while queue:
+        cost, node = heapq.heappop(queue)
+        if count_pops:
+            ops.pops += 1
+        if node in settled or cost > costs[node]:
+            continue
+        settled.add(node)
+        order.append(node)
+        if node == target:
+            break
+        start, end = offsets[node], offsets[node + 1]
+        if count_expansions:
+            ops.expansions += 1
+        if count_relaxations:
+            ops.relaxations += int(end - start)
+        for neighbor, weight in zip(targets[start:end].tolist(), weights[start:end].tolist()):
+            new_cost = cost + weight
+            if neighbor not in costs or new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heapq.heappush(queue, (new_cost, neighbor))
+                if count_pushes:
+                    ops.pushes += 1
+    return order, costs, parents
+
+def csr_path(parents, target):
+    if target not in parents:
+        return []
+    path = []
+    node = target
+    while node != -1:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
@@ -0,0 +1,194 @@
+# Out-of-core external merge sort for integer dump files larger than memory
+#
+#   python external_sort.py dump.bin sorted.bin --dtype "<i8" --memory-mb 256
+#   python external_sort.py numbers.txt sorted.txt --text --engine merge
+
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+from collections import deque
+
+import numpy as np
+
+import integer_sorts
+import sorting
+
+DEFAULT_MEMORY = 256 * 1024 * 1024
+FAN_IN = 64
+ENGINES = ["radix", "merge", "introsort"]
+# Rough resident bytes per element while a chunk is being sorted: the list
+# engines box every value (pointer + int object), radix keeps a few arrays.
+BYTES_PER_ITEM = {"radix": 32, "merge": 80, "introsort": 48}
+
+# ----------------- Paths -----------------
+
+def resolve_within(root, path):
+    # Resolve path relative to root and refuse anything that escapes it,
+    # whether through an absolute path, "..", or a symlink.
+    base = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, resolved]) != base:
+        raise ValueError(f"'{path}' is outside the working directory {root}")
+    return resolved
+
+# ----------------- Chunk Readers -----------------
+
+def binary_chunks(path, dtype, chunk_items):
+    data = np.memmap(path, dtype=dtype, mode="r") if os.path.getsize(path) else np.zeros(0, dtype)
+    for start in range(0, len(data), chunk_items):
+        yield np.array(data[start:start + chunk_items])
+
+def text_chunks(path, dtype, chunk_items, chunk_bytes=None):
+    # Whitespace-separated integers; a token split across two reads is carried over.
+    chunk_bytes = chunk_bytes or chunk_items * 8
+    carry = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            block = carry + block
+            cut = max(block.rfind(b"\n"), block.rfind(b" "), block.rfind(b"\t"))
+            if cut < 0:
+                carry = block
+                continue
+            carry = block[cut + 1:]
+            yield np.array(block[:cut + 1].split(), dtype=dtype)
+    if carry.strip():
+        yield np.array(carry.split(), dtype=dtype)
+
+def count_items(path, dtype, text):
+    if text:
+        return None
+    return os.path.getsize(path) // np.dtype(dtype).itemsize
+
+# ----------------- Run Formation -----------------
+
+def sort_chunk(chunk, engine):
+    if engine == "radix":
+        return integer_sorts.radix_sort(chunk)
+    values = chunk.tolist()
+    if engine == "merge":
+        sorting.buffered_merge_sort(values)
+    else:
+        deque(sorting.introsort(values), maxlen=0)
+    return np.asarray(values, dtype=chunk.dtype)
+
+# ----------------- K-way Merge -----------------
+
+def merge_runs(paths, dtype, block_items):
+    # Each run is memory-mapped and read one block at a time. A heap keyed on
+    # every buffer's last value gives a bound: everything at or below the
+    # smallest last value can be emitted, since all unread data is larger.
+    runs = [np.memmap(path, dtype=dtype, mode="r") for path in paths if os.path.getsize(path)]
+    positions = [0] * len(runs)
+    buffers = [np.zeros(0, dtype)] * len(runs)
+    heap = []
+
+    def refill(i):
+        start = positions[i]
+        block = np.array(runs[i][start:start + block_items])
+        positions[i] = start + len(block)
+        buffers[i] = block
+        if len(block):
+            heapq.heappush(heap, (block[-1], i))
+
+    for i in range(len(runs)):
+        refill(i)
+    while heap:
+        bound, i = heapq.heappop(heap)
+        pieces = []
+        for j, buffer in enumerate(buffers):
+            cut = int(np.searchsorted(buffer, bound, side="right"))
+            if cut:
+                pieces.append(buffer[:cut])
+                buffers[j] = buffer[cut:]
+        if pieces:
+            merged = np.concatenate(pieces)
+            merged.sort(kind="stable")
+            yield merged
+        if not len(buffers[i]):
+            refill(i)
+
+# ----------------- External Sort -----------------
+
+def external_sort_steps(input_path, output_path, dtype="<i8", text=False, memory_bytes=DEFAULT_MEMORY,
+                        engine="radix", fan_in=FAN_IN, tmp_dir=None):
+    # Yields progress events: ("run", index, items_done, total_items) while
+    # sorted runs are spilled, then ("merge", pass, items_done, total_items).
+    # total_items is None for text input until every chunk has been read.
+    if engine not in ENGINES:
+        raise ValueError(f"unknown external sort engine: {engine}")
+    dtype = np.dtype(dtype)
+    if engine == "radix" and dtype.kind not in "iu":
+        raise ValueError("the radix engine needs an integer dtype")
+    chunk_items = max(1, memory_bytes // BYTES_PER_ITEM[engine])
+    total = count_items(input_path, dtype, text)
+    chunks = text_chunks(input_path, dtype, chunk_items) if text else binary_chunks(input_path, dtype, chunk_items)
+    with tempfile.TemporaryDirectory(dir=tmp_dir, prefix="extsort-") as work:
+        runs = []
+        done = 0
+        for chunk in chunks:
+            path = os.path.join(work, f"run-0-{len(runs):06d}.bin")
+            sort_chunk(chunk, engine).astype(dtype, copy=False).tofile(path)
+            runs.append(path)
+            done += len(chunk)
+            yield "run", len(runs) - 1, done, total
+        total = done
+        block_items = max(1, memory_bytes // dtype.itemsize // (fan_in + 2))
+        level = 0
+        while len(runs) > fan_in:
+            level += 1
+            merged_runs = []
+            done = 0
+            for start in range(0, len(runs), fan_in):
+                path = os.path.join(work, f"run-{level}-{len(merged_runs):06d}.bin")
+                with open(path, "wb") as out:
+                    for block in merge_runs(runs[start:start + fan_in], dtype, block_items):
+                        block.tofile(out)
+                        done += len(block)
+                        yield "merge", level, done, total
+                for old in runs[start:start + fan_in]:
+                    os.remove(old)
+                merged_runs.append(path)
+            runs = merged_runs
+        level += 1
+        done = 0
+        with open(output_path, "w" if text else "wb") as out:
+            for block in merge_runs(runs, dtype, block_items):
+                if text:
+                    out.write("\n".join(map(str, block.tolist())) + "\n")
+                else:
+                    block.tofile(out)
+                done += len(block)
+                yield "merge", level, done, total
+        if not done:
+            yield "merge", level, 0, total
+
+def external_sort(input_path, output_path, **options):
+    deque(external_sort_steps(input_path, output_path, **options), maxlen=0)
+    return output_path
+
+# ----------------- Command Line -----------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sort an integer dump file that may not fit in memory.")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--dtype", default="<i8", help="NumPy dtype of binary input (default little-endian int64)")
+    parser.add_argument("--text", action="store_true", help="input and output are whitespace-separated text")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY // (1024 * 1024))
+    parser.add_argument("--engine", choices=ENGINES, default="radix")
+    parser.add_argument("--fan-in", type=int, default=FAN_IN)
+    parser.add_argument("--tmp-dir")
+    args = parser.parse_args(argv)
+    for phase, step, done, total in external_sort_steps(args.input, args.output, args.dtype, args.text,
+                                                        args.memory_mb * 1024 * 1024, args.engine,
+                                                        args.fan_in, args.tmp_dir):
+        print(f"\r{phase} {step}: {done}/{total if total is not None else '?'}", end="", file=sys.stderr)
+    print(file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
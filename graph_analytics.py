@@ -0,0 +1,230 @@
+# Linear-time graph analytics: union-find components, strongly connected components and topological order
+
+from collections import deque
+
+import numpy as np
+
+# ----------------- Union-Find -----------------
+
+class UnionFind:
+    # Disjoint sets over dense ids 0..n-1 with path compression and union by rank.
+    def __init__(self, size=0):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+        self.count = size
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self):
+        self.parent.append(len(self.parent))
+        self.rank.append(0)
+        self.count += 1
+        return len(self.parent) - 1
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        rank = self.rank
+        if rank[a] < rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+        self.count -= 1
+        return True
+
+    def roots(self):
+        return np.fromiter((self.find(x) for x in range(len(self.parent))), dtype=np.int64, count=len(self.parent))
+
+def _edge_pairs(csr):
+    sources = np.repeat(np.arange(csr.number_of_nodes(), dtype=np.int64), np.diff(csr.offsets))
+    targets = csr.targets
+    if not csr.directed:
+        # Undirected CSR stores every edge in both directions; one copy is enough.
+        keep = sources <= targets
+        sources, targets = sources[keep], targets[keep]
+    return sources, targets
+
+def _relabel(roots):
+    # Number components 0..k-1 in order of their first node.
+    _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+    order = np.argsort(np.argsort(first, kind='stable'), kind='stable')
+    return order[inverse].astype(np.int64), len(first)
+
+# ----------------- Connected Components -----------------
+
+def connected_components(csr):
+    # Weakly connected components for directed graphs.
+    sets = UnionFind(csr.number_of_nodes())
+    union = sets.union
+    for u, v in zip(*(side.tolist() for side in _edge_pairs(csr))):
+        union(u, v)
+    return _relabel(sets.roots())
+
+def group_nodes(csr, components, count):
+    groups = [[] for _ in range(count)]
+    for label, component in zip(csr.labels, components.tolist()):
+        groups[component].append(label)
+    groups.sort(key=len, reverse=True)
+    return groups
+
+# ----------------- Strongly Connected Components -----------------
+
+def strongly_connected_components(csr):
+    # Iterative Tarjan; components come out in reverse topological order of the condensation.
+    n = csr.number_of_nodes()
+    offsets, targets = csr.offsets.tolist(), csr.targets.tolist()
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    components = [-1] * n
+    stack = []
+    counter = 0
+    count = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, offsets[root])]
+        while work:
+            node, position = work[-1]
+            end = offsets[node + 1]
+            while position < end:
+                neighbor = targets[position]
+                position += 1
+                if index[neighbor] == -1:
+                    work[-1] = (node, position)
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = True
+                    work.append((neighbor, offsets[neighbor]))
+                    break
+                if on_stack[neighbor] and index[neighbor] < low[node]:
+                    low[node] = index[neighbor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        components[member] = count
+                        if member == node:
+                            break
+                    count += 1
+    return np.asarray(components, dtype=np.int64), count
+
+# ----------------- Topological Order and Cycles -----------------
+
+def topological_sort(csr):
+    # Kahn's algorithm. Returns the order and whether it covers every node;
+    # a short order means the leftover nodes sit on or behind a cycle.
+    if not csr.directed:
+        raise ValueError("Topological order is only defined for directed graphs.")
+    n = csr.number_of_nodes()
+    offsets, targets = csr.offsets.tolist(), csr.targets.tolist()
+    indegree = np.bincount(csr.targets, minlength=n).tolist()
+    queue = deque(node for node in range(n) if indegree[node] == 0)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for neighbor in targets[offsets[node]:offsets[node + 1]]:
+            indegree[neighbor] -= 1
+            if indegree[neighbor] == 0:
+                queue.append(neighbor)
+    return np.asarray(order, dtype=np.int64), len(order) == n
+
+def has_cycle(csr):
+    if csr.directed:
+        return not topological_sort(csr)[1]
+    sets = UnionFind(csr.number_of_nodes())
+    union = sets.union
+    return not all(union(u, v) for u, v in zip(*(side.tolist() for side in _edge_pairs(csr))))
+
+def cyclic_nodes(csr):
+    # Directed graphs: every node inside a non-trivial SCC or carrying a self-loop.
+    components, count = strongly_connected_components(csr)
+    sizes = np.bincount(components, minlength=count)
+    on_cycle = sizes[components] > 1
+    sources, targets = _edge_pairs(csr)
+    on_cycle[sources[sources == targets]] = True
+    return csr.to_labels(np.flatnonzero(on_cycle).tolist())
+
+# ----------------- Incremental Components -----------------
+
+class ComponentTracker:
+    # Connected components of a live networkx graph. Node and edge additions are
+    # folded into the union-find as they happen; removals cannot be undone in a
+    # union-find, so they mark the structure stale and the next query rebuilds it.
+    def __init__(self, graph):
+        self.graph = graph
+        self.rebuilds = 0
+        self._rebuild()
+
+    def _rebuild(self):
+        self.ids = {node: i for i, node in enumerate(self.graph.nodes)}
+        self.sets = UnionFind(len(self.ids))
+        for u, v in self.graph.edges():
+            self.sets.union(self.ids[u], self.ids[v])
+        self.stale = False
+        self.rebuilds += 1
+
+    def _id(self, node):
+        if node not in self.ids:
+            self.ids[node] = self.sets.add()
+        return self.ids[node]
+
+    def add_node(self, node):
+        if not self.stale:
+            self._id(node)
+
+    def add_edge(self, u, v):
+        if not self.stale:
+            self.sets.union(self._id(u), self._id(v))
+
+    def apply(self, op, *args):
+        if op == "add_node":
+            self.add_node(args[0])
+        elif op == "add_edge":
+            self.add_edge(args[0], args[1])
+        elif op in ("remove_node", "remove_edge"):
+            self.stale = True
+
+    @property
+    def count(self):
+        if self.stale:
+            self._rebuild()
+        return self.sets.count
+
+    def connected(self, u, v):
+        if self.stale:
+            self._rebuild()
+        return self.sets.find(self.ids[u]) == self.sets.find(self.ids[v])
+
+    def groups(self):
+        # Node -> component number, numbered by first node in graph order.
+        if self.stale:
+            self._rebuild()
+        nodes = list(self.ids)
+        roots = np.fromiter((self.sets.find(self.ids[node]) for node in nodes), dtype=np.int64, count=len(nodes))
+        components, _ = _relabel(roots)
+        return dict(zip(nodes, components.tolist()))
@@ -0,0 +1,178 @@
+# Bulk graph import/export: streaming edge-list/CSV parsing and a memory-mapped binary format
+
+import csv
+import io
+import json
+import struct
+from array import array
+from itertools import islice
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+CHUNK_ROWS = 1 << 16
+MAGIC = b"CSRG"
+# magic, version, nodes, entries, directed, weight kind, padding, labels length; the
+# padding keeps the header (and so every int64 array after it) 8-byte aligned.
+HEADER = struct.Struct("<4sIQQ?c6xQ")
+LEGACY_HEADER = struct.Struct("<4sIQQ?cQ")   # version 1, unaligned
+FORMAT_VERSION = 2
+
+# ----------------- Text Import -----------------
+
+def _open_text(source):
+    if isinstance(source, str):
+        return open(source, newline=""), True
+    if isinstance(source, io.TextIOBase):
+        return source, False
+    return io.TextIOWrapper(source, encoding="utf-8", newline=""), False
+
+def _rows(f, delimiter):
+    if delimiter is None:
+        return (line.split() for line in f)
+    return csv.reader(f, delimiter=delimiter)
+
+def iter_edge_chunks(source, delimiter=None, chunk_size=CHUNK_ROWS):
+    f, owned = _open_text(source)
+    try:
+        rows = (row for row in _rows(f, delimiter) if row and not row[0].lstrip().startswith("#"))
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        if owned:
+            f.close()
+
+def read_edges(source, delimiter=None, chunk_size=CHUNK_ROWS):
+    ids = {}
+    labels = []
+    sources = array("q")
+    targets = array("q")
+    weights = array("d")
+    first = True
+    for chunk in iter_edge_chunks(source, delimiter, chunk_size):
+        if first:
+            first = False
+            if _is_header(chunk[0]):
+                chunk = chunk[1:]
+        for row in chunk:
+            if len(row) < 2:
+                raise ValueError(f"edge row needs at least two columns: {row!r}")
+            for label, out in ((row[0].strip(), sources), (row[1].strip(), targets)):
+                node = ids.get(label)
+                if node is None:
+                    node = ids[label] = len(labels)
+                    labels.append(label)
+                out.append(node)
+            weights.append(float(row[2]) if len(row) > 2 and row[2].strip() else 1.0)
+    weights = np.frombuffer(weights, dtype=np.float64) if len(weights) else np.zeros(0)
+    if np.all(weights == np.round(weights)):
+        weights = weights.astype(np.int64)
+    return labels, np.frombuffer(sources, dtype=np.int64), np.frombuffer(targets, dtype=np.int64), weights
+
+def _is_header(row):
+    if len(row) < 3:
+        return False
+    try:
+        float(row[2])
+        return False
+    except ValueError:
+        return True
+
+def guess_delimiter(name):
+    return "," if name.lower().endswith(".csv") else None
+
+def load_csr(source, directed=False, delimiter=None):
+    labels, sources, targets, weights = read_edges(source, delimiter)
+    return CSRGraph.from_arrays(len(labels), sources, targets, weights, directed, labels)
+
+# ----------------- networkx Bridge -----------------
+
+def csr_edges(csr):
+    sources = np.repeat(np.arange(csr.number_of_nodes()), np.diff(csr.offsets))
+    targets = csr.targets
+    weights = csr.weights
+    if not csr.directed:
+        keep = sources <= targets
+        sources, targets, weights = sources[keep], targets[keep], weights[keep]
+    return sources, targets, weights
+
+def csr_to_networkx(csr, chunk_size=CHUNK_ROWS):
+    import networkx as nx
+    graph = nx.DiGraph() if csr.directed else nx.Graph()
+    labels = csr.labels
+    graph.add_nodes_from(labels)
+    sources, targets, weights = csr_edges(csr)
+    for start in range(0, len(sources), chunk_size):
+        stop = start + chunk_size
+        graph.add_weighted_edges_from(
+            (labels[u], labels[v], w) for u, v, w in zip(sources[start:stop].tolist(),
+                                                        targets[start:stop].tolist(),
+                                                        weights[start:stop].tolist()))
+    return graph
+
+def load_networkx(source, directed=False, delimiter=None):
+    return csr_to_networkx(load_csr(source, directed, delimiter))
+
+# ----------------- Text Export -----------------
+
+def write_edge_list(csr, target, delimiter=",", chunk_size=CHUNK_ROWS):
+    owned = isinstance(target, str)
+    f = open(target, "w", newline="") if owned else target
+    try:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(["source", "target", "weight"])
+        labels = csr.labels
+        sources, targets, weights = csr_edges(csr)
+        for start in range(0, len(sources), chunk_size):
+            stop = start + chunk_size
+            writer.writerows((labels[u], labels[v], w) for u, v, w in zip(sources[start:stop].tolist(),
+                                                                          targets[start:stop].tolist(),
+                                                                          weights[start:stop].tolist()))
+    finally:
+        if owned:
+            f.close()
+
+# ----------------- Binary Format -----------------
+
+def save_binary(csr, target):
+    owned = isinstance(target, str)
+    f = open(target, "wb") if owned else target
+    try:
+        labels = json.dumps(csr.labels).encode()
+        weight_kind = b"i" if csr.weights.dtype.kind in "iu" else b"f"
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, csr.number_of_nodes(), len(csr.targets),
+                            csr.directed, weight_kind, len(labels)))
+        f.write(np.ascontiguousarray(csr.offsets, dtype="<i8").tobytes())
+        f.write(np.ascontiguousarray(csr.targets, dtype="<i8").tobytes())
+        f.write(np.ascontiguousarray(csr.weights, dtype="<i8" if weight_kind == b"i" else "<f8").tobytes())
+        f.write(labels)
+    finally:
+        if owned:
+            f.close()
+
+def load_binary(source):
+    if isinstance(source, str):
+        buffer = np.memmap(source, dtype=np.uint8, mode="r")
+    else:
+        buffer = np.frombuffer(source if isinstance(source, (bytes, bytearray, memoryview)) else source.read(),
+                               dtype=np.uint8)
+    header = bytes(buffer[:HEADER.size])
+    if len(header) < LEGACY_HEADER.size or header[:4] != MAGIC:
+        raise ValueError("not a CSR graph file")
+    layout = {1: LEGACY_HEADER, FORMAT_VERSION: HEADER}.get(struct.unpack_from("<I", header, 4)[0])
+    if layout is None or len(header) < layout.size:
+        raise ValueError("unsupported CSR graph file version")
+    magic, version, nodes, entries, directed, weight_kind, labels_length = layout.unpack_from(header)
+    position = layout.size
+    offsets = buffer[position:position + 8 * (nodes + 1)].view("<i8")
+    position += 8 * (nodes + 1)
+    targets = buffer[position:position + 8 * entries].view("<i8")
+    position += 8 * entries
+    weights = buffer[position:position + 8 * entries].view("<i8" if weight_kind == b"i" else "<f8")
+    position += 8 * entries
+    labels = json.loads(bytes(buffer[position:position + labels_length]))
+    return CSRGraph(labels, offsets, targets, weights, directed)
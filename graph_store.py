@@ -0,0 +1,127 @@
+# Persistent graph store: append-only mutation log compacted into binary CSR snapshots
+
+import json
+import os
+import threading
+
+from csr_graph import CSRGraph
+from graph_io import csr_to_networkx, load_binary, save_binary
+
+COMPACT_EVERY = 1000
+
+# ----------------- Mutations -----------------
+
+def apply_mutation(graph, op, args):
+    if op == "add_node":
+        graph.add_node(args[0])
+    elif op == "remove_node":
+        if graph.has_node(args[0]):
+            graph.remove_node(args[0])
+    elif op == "add_edge":
+        graph.add_edge(args[0], args[1], weight=args[2])
+    elif op == "remove_edge":
+        if graph.has_edge(args[0], args[1]):
+            graph.remove_edge(args[0], args[1])
+    else:
+        raise ValueError(f"unknown graph mutation: {op}")
+
+def convert_graph(graph, directed):
+    if graph.is_directed() == directed:
+        return graph
+    return graph.to_directed() if directed else graph.to_undirected()
+
+# ----------------- Graph Store -----------------
+
+class GraphStore:
+    def __init__(self, directory="data", name="graph", compact_every=COMPACT_EVERY):
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, f"{name}.bin")
+        self.log_path = os.path.join(directory, f"{name}.log.jsonl")
+        self.compact_every = compact_every
+        self.csr = None
+        self._pending = 0
+        self._log = None
+        # One store may be shared by several app sessions (threads).
+        self.lock = threading.RLock()
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.log_path)
+
+    def load(self, directed=False):
+        with self.lock:
+            return self._load(directed)
+
+    def _load(self, directed):
+        import networkx as nx
+        self.csr = None
+        if os.path.exists(self.snapshot_path):
+            csr = load_binary(self.snapshot_path)
+            graph = csr_to_networkx(csr)
+        else:
+            csr = None
+            graph = nx.DiGraph() if directed else nx.Graph()
+        self._pending = 0
+        for op, args in self._read_log():
+            apply_mutation(graph, op, args)
+            self._pending += 1
+        if csr is not None and self._pending == 0:
+            self.csr = csr
+        return graph
+
+    def _read_log(self):
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op, args = json.loads(line)
+                except ValueError:
+                    continue   # torn write from an interrupted append
+                yield op, args
+
+    def record(self, graph, op, *args):
+        with self.lock:
+            self._record(graph, op, args)
+
+    def _record(self, graph, op, args):
+        if self._log is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._log = open(self.log_path, "a+", encoding="utf-8")
+            if self._log.tell() > 0:
+                self._log.seek(self._log.tell() - 1)
+                if self._log.read(1) != "\n":
+                    self._log.write("\n")
+        self._log.write(json.dumps([op, list(args)]) + "\n")
+        self._log.flush()
+        self._pending += 1
+        if self._pending >= self.compact_every:
+            self.compact(graph.is_directed())
+
+    def compact(self, directed=False):
+        # Rebuild from what is on disk rather than from the caller's graph, so
+        # mutations logged by other sessions sharing this store survive.
+        with self.lock:
+            self.close()
+            self.save(self._load(directed))
+
+    def save(self, graph):
+        with self.lock:
+            self._save(graph)
+
+    def _save(self, graph):
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = self.snapshot_path + ".tmp"
+        save_binary(CSRGraph.from_networkx(graph), temp_path)
+        os.replace(temp_path, self.snapshot_path)
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self._pending = 0
+
+    def close(self):
+        with self.lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
@@ -0,0 +1,113 @@
+# NumPy non-comparison sorts (counting / LSD radix) for integer arrays
+
+import numpy as np
+
+import sorting
+
+COUNTING_RANGE_LIMIT = 1 << 20
+RADIX_BITS = 16
+
+# ----------------- Bulk Sorts -----------------
+
+def counting_fits(keys, range_limit=COUNTING_RANGE_LIMIT):
+    # The count array has one slot per value in [min, max]; past this span radix sort wins
+    # and, for spans like [1, 10**12], the count array would not fit in memory at all.
+    return int(keys.max()) - int(keys.min()) <= max(range_limit, 2 * keys.size)
+
+def counting_sort(values, range_limit=COUNTING_RANGE_LIMIT):
+    keys = np.asarray(values)
+    if keys.size == 0:
+        return keys.copy()
+    if not counting_fits(keys, range_limit):
+        return radix_sort(keys)
+    low = keys.min()
+    counts = np.bincount(keys - low)
+    return np.repeat(np.arange(low, low + len(counts), dtype=keys.dtype), counts)
+
+def _radix_keys(keys):
+    # Shift to non-negative offsets and keep them in the narrowest unsigned type.
+    low = int(keys.min())
+    span = int(keys.max()) - low
+    key_type = np.uint32 if span < (1 << 32) else np.uint64
+    return (keys.astype(np.int64) - low).astype(key_type), low
+
+def radix_sort(values, bits=RADIX_BITS):
+    keys = np.asarray(values)
+    if keys.size == 0:
+        return keys.copy()
+    shifted, low = _radix_keys(keys)
+    key_type = shifted.dtype.type
+    digit_type = np.uint8 if bits <= 8 else np.uint16
+    mask = key_type((1 << bits) - 1)
+    top = int(shifted.max())
+    shift = 0
+    while top >> shift:
+        # Stable sort on one small-int digit; NumPy uses a radix sort for 8/16-bit keys.
+        digits = ((shifted >> key_type(shift)) & mask).astype(digit_type)
+        shifted = shifted[np.argsort(digits, kind='stable')]
+        shift += bits
+    return (shifted.astype(np.int64) + low).astype(keys.dtype)
+
+def is_integer_array(values):
+    keys = np.asarray(values)
+    return keys.dtype.kind in "iu"
+
+def auto_sort(values, range_limit=COUNTING_RANGE_LIMIT):
+    keys = np.asarray(values)
+    if keys.dtype.kind not in "iu":
+        result = sorting.buffered_merge_sort(list(values))
+        return np.asarray(result) if isinstance(values, np.ndarray) else result
+    if keys.size and counting_fits(keys, range_limit):
+        result = counting_sort(keys, range_limit)
+    else:
+        result = radix_sort(keys)
+    return result if isinstance(values, np.ndarray) else result.tolist()
+
+# ----------------- Step Generators -----------------
+
+def counting_sort_steps(arr, trace=None, range_limit=COUNTING_RANGE_LIMIT):
+    if not arr:
+        return
+    keys = np.asarray(arr)
+    if not counting_fits(keys, range_limit):
+        yield from radix_sort_steps(arr, trace)
+        return
+    low = int(keys.min())
+    counts = np.bincount(keys - low)
+    start = 0
+    for offset in np.flatnonzero(counts).tolist():
+        count = int(counts[offset])
+        block = [low + offset] * count
+        if trace is not None:
+            trace.write_block(start, arr[start:start + count], block)
+        arr[start:start + count] = block
+        start += count
+        yield arr
+
+def radix_sort_steps(arr, trace=None, bits=4):
+    if not arr:
+        return
+    shifted, low = _radix_keys(np.asarray(arr))
+    key_type = shifted.dtype.type
+    mask = key_type((1 << bits) - 1)
+    top = int(shifted.max())
+    shift = 0
+    while top >> shift:
+        digits = ((shifted >> key_type(shift)) & mask).astype(np.uint8)
+        shifted = shifted[np.argsort(digits, kind='stable')]
+        new = (shifted.astype(np.int64) + low).tolist()
+        if trace is not None:
+            trace.write_block(0, arr, new)
+        arr[:] = new
+        shift += bits
+        yield arr
+
+def auto_sort_steps(arr, trace=None, range_limit=COUNTING_RANGE_LIMIT):
+    # Step-producing counterpart of auto_sort: counting sort for bounded integer
+    # ranges, radix sort for wide ones, natural merge sort for anything else.
+    if not arr:
+        return
+    if is_integer_array(arr):
+        yield from counting_sort_steps(arr, trace, range_limit)
+    else:
+        yield from sorting.buffered_merge_sort(arr, "natural", steps=True, trace=trace)
@@ -1,41 +1,76 @@
 # Simple To-Do List App
 
-tasks = []
+from task_store import TaskStore
+
+PAGE_SIZE = 20
+
+tasks = TaskStore("tasks.log")
 
 def show_tasks():
-    if not tasks:
+    if not len(tasks):
         print("No tasks yet.")
-    else:
-        print("\nYour tasks:")
-        for i, task in enumerate(tasks, 1):
+        return
+    pages = -(-len(tasks) // PAGE_SIZE)
+    page = 1
+    while True:
+        print(f"\nYour tasks (page {page}/{pages}, {len(tasks)} total):")
+        for i, task in tasks.page(page, PAGE_SIZE):
             print(f"{i}. {task}")
+        if page >= pages:
+            break
+        answer = input("Enter for next page, a page number, or q to stop: ").strip()
+        if answer.lower() == 'q':
+            break
+        page = int(answer) if answer.isdigit() and 1 <= int(answer) <= pages else page + 1
 
 def add_task():
     task = input("Enter a new task: ")
-    tasks.append(task)
+    tasks.add(task)
     print(f"Task '{task}' added!")
 
 def delete_task():
-    show_tasks()
+    if not len(tasks):
+        print("No tasks yet.")
+        return
     try:
-        num = int(input("Enter the task number to delete: "))
+        num = int(input(f"Enter the task number to delete (1-{len(tasks)}): "))
         if 1 <= num <= len(tasks):
-            removed = tasks.pop(num - 1)
+            removed = tasks.delete(num)
             print(f"Task '{removed}' deleted!")
         else:
             print("Invalid task number.")
     except ValueError:
         print("Please enter a valid number.")
 
+def search_tasks():
+    query = input("Search for: ")
+    results = tasks.search(query, limit=PAGE_SIZE * 5)
+    if not results:
+        print("No matching tasks.")
+    for i, task in results:
+        print(f"{i}. {task}")
+
+def import_tasks():
+    path = input("File with one task per line: ")
+    try:
+        count = tasks.import_file(path)
+        print(f"Imported {count} tasks.")
+    except OSError as e:
+        print(f"Could not read '{path}': {e}")
+    except UnicodeDecodeError:
+        print(f"'{path}' is not a UTF-8 text file.")
+
 def main():
     while True:
         print("\n--- To-Do List Menu ---")
         print("1. Show tasks")
         print("2. Add task")
         print("3. Delete task")
-        print("4. Exit")
+        print("4. Search tasks")
+        print("5. Import tasks from file")
+        print("6. Exit")
 
-        choice = input("Choose an option (1-4): ")
+        choice = input("Choose an option (1-6): ")
         if choice == '1':
             show_tasks()
         elif choice == '2':
@@ -43,6 +78,11 @@ def main():
         elif choice == '3':
             delete_task()
         elif choice == '4':
+            search_tasks()
+        elif choice == '5':
+            import_tasks()
+        elif choice == '6':
+            tasks.close()
             print("Goodbye!")
             break
         else:
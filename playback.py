@@ -0,0 +1,205 @@
+# Lazy playback engine: frames are pulled from algorithm generators or step traces
+# on a background thread into a bounded buffer, with pause/resume/seek and frame skipping
+
+import sys
+import threading
+import time
+from collections import deque
+from itertools import islice
+
+from step_trace import StepTrace
+
+BUFFER_FRAMES = 64
+BUFFER_BYTES = 32 * 1024 * 1024
+
+def snapshot(frame):
+    # Generators and traces yield their live state; copy it before it moves on.
+    if isinstance(frame, tuple):
+        return (list(frame[0]),) + tuple(frame[1:])
+    return list(frame)
+
+def frame_bytes(frame):
+    # Each snapshot is a fresh list of references to shared values, so the
+    # list itself is what the buffer pays for.
+    if isinstance(frame, tuple):
+        return sum(sys.getsizeof(part) for part in frame)
+    return sys.getsizeof(frame)
+
+# ----------------- Player -----------------
+
+class Player:
+    # source is a StepTrace (seekable in both directions) or any iterable of
+    # frames (seek can only move forward). Frames carry their step index.
+    def __init__(self, source, start=0, highlights=False, buffer_frames=BUFFER_FRAMES, buffer_bytes=BUFFER_BYTES):
+        self.source = source
+        self.highlights = highlights
+        self.buffer_frames = buffer_frames
+        self.buffer_bytes = buffer_bytes
+        self._limit = buffer_frames
+        self.position = start
+        self.skipped = 0
+        self.paused = False
+        self.finished = False
+        self.closed = False
+        self.error = None
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._seek_to = None
+        self._generation = 0
+        self._iterator = None if isinstance(source, StepTrace) else iter(source)
+        self._thread = threading.Thread(target=self._produce, args=(start,), name="playback", daemon=True)
+        self._thread.start()
+
+    def __len__(self):
+        return len(self.source) if isinstance(self.source, StepTrace) else 0
+
+    # -------- Producer --------
+
+    def _open(self, start):
+        if self.highlights:
+            return self.source.frames_with_highlights(start)
+        return self.source.frames(start)
+
+    def _produce(self, start):
+        # An algorithm that raises must still end playback, so the consumer
+        # gets the error instead of waiting for frames that never come.
+        try:
+            self._fill(start)
+        except Exception as e:
+            with self._cond:
+                self.error = e
+                self.finished = True
+                self._cond.notify_all()
+
+    def _fill(self, start):
+        seekable = isinstance(self.source, StepTrace)
+        iterator = self._open(start) if seekable else self._iterator
+        index = start
+        if not seekable and start:
+            index = self._advance(iterator, 0, start)
+        while True:
+            with self._cond:
+                while not self.closed and self._seek_to is None and \
+                        (self.finished or len(self._queue) >= self._limit):
+                    self._cond.wait()
+                if self.closed:
+                    return
+                target, self._seek_to = self._seek_to, None
+                generation = self._generation
+            if target is not None:
+                if seekable:
+                    target = max(0, min(target, len(self.source) - 1))
+                    iterator, index = self._open(target), target
+                else:
+                    index = self._advance(iterator, index, target)
+            try:
+                frame = snapshot(next(iterator))
+            except StopIteration:
+                with self._cond:
+                    if generation == self._generation:
+                        self.finished = True
+                        self._cond.notify_all()
+                continue
+            # Long arrays get fewer buffered frames so the buffer stays within buffer_bytes.
+            limit = max(1, min(self.buffer_frames, self.buffer_bytes // frame_bytes(frame)))
+            with self._cond:
+                self._limit = limit
+                if generation == self._generation:
+                    self._queue.append((index, frame))
+                    self._cond.notify_all()
+            index += 1
+
+    @staticmethod
+    def _advance(iterator, index, target):
+        skip = max(0, target - index)
+        return index + sum(1 for _ in islice(iterator, skip))
+
+    # -------- Controls --------
+
+    def pause(self):
+        with self._cond:
+            self.paused = True
+            self._cond.notify_all()
+
+    def resume(self):
+        with self._cond:
+            self.paused = False
+            self._cond.notify_all()
+
+    def toggle(self):
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def seek(self, index):
+        with self._cond:
+            if self._queue and self._queue[0][0] <= index <= self._queue[-1][0]:
+                while self._queue[0][0] < index:
+                    self._queue.popleft()
+                self._cond.notify_all()
+                return
+            if self.error is not None:
+                # The producer has stopped; there is nothing left to seek in.
+                return
+            self._generation += 1
+            self._queue.clear()
+            self._seek_to = index
+            self.finished = False
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+        # A StepTrace has a single replay cursor, so let the producer finish
+        # its current frame before anyone else replays the same trace.
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=1)
+
+    # -------- Consumer --------
+
+    def _raise_error(self):
+        # Frames produced before the failure are played first, then the error surfaces.
+        if self.error is not None and not self.closed:
+            raise self.error
+
+    def get(self, timeout=None):
+        # Next buffered (index, frame), or None once the source is exhausted.
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._queue or self.finished or self.closed, timeout):
+                return None
+            if not self._queue:
+                self._raise_error()
+                return None
+            item = self._queue.popleft()
+            self._cond.notify_all()
+        self.position = item[0]
+        return item
+
+    def play(self, speed):
+        # Yields frames on a `speed`-second clock until paused, closed or done.
+        # When rendering falls behind, buffered frames that are already late
+        # are dropped so the display keeps pace with the clock.
+        tick = time.perf_counter()
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self.finished or self.closed or self.paused)
+                if self.paused or self.closed or not self._queue:
+                    self._raise_error()
+                    return
+                late = int((time.perf_counter() - tick) / speed) if speed > 0 else 0
+                drop = min(late, len(self._queue) - 1)
+                for _ in range(drop):
+                    self._queue.popleft()
+                self.skipped += drop
+                index, frame = self._queue.popleft()
+                self._cond.notify_all()
+                tick += (drop + 1) * speed
+            self.position = index
+            yield frame
+            with self._cond:
+                delay = tick - time.perf_counter()
+                if delay > 0:
+                    self._cond.wait_for(lambda: self.paused or self.closed, delay)
@@ -0,0 +1,272 @@
+# Reusable-figure renderers: build the scene once, then only recolor/resize per frame
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# matplotlib and networkx are imported inside the renderers so that importing
+# this module (and the apps that use it) stays cheap until something is drawn.
+
+_export_pool = ThreadPoolExecutor(max_workers=1)
+
+# Level-of-detail thresholds: above these sizes labels are dropped, edges are
+# sampled, node clouds are binned into a density image and arrays are downsampled.
+LABEL_NODE_LIMIT = 200
+EDGE_LABEL_LIMIT = 100
+LOD_NODE_LIMIT = 500
+EDGE_SAMPLE_LIMIT = 5000
+RASTER_NODE_LIMIT = 5000
+RASTER_BINS = 256
+CELL_LIMIT = 60
+BAR_LIMIT = 500
+ARRAY_BINS = 512
+ARRAY_VIEWS = ["bars", "heatmap"]
+GROUP_COLORMAP = 'tab20'
+
+# ----------------- Graph Renderer -----------------
+
+def group_colors(nodes, groups, base_color):
+    # One color per group (component id, SCC id, ...); nodes without a group keep the base color.
+    from matplotlib import colormaps
+    colors = np.tile(base_color, (len(nodes), 1))
+    if groups:
+        cmap = colormaps[GROUP_COLORMAP]
+        for i, node in enumerate(nodes):
+            group = groups.get(node)
+            if group is not None:
+                colors[i] = cmap(group % cmap.N)
+    return colors
+
+class GraphRenderer:
+    def __init__(self, graph, pos, zoom, color, directed=False, base_color='lightblue',
+                 node_size=700, font_size=18, edge_font_size=10, figsize=(10, 7),
+                 label_limit=LABEL_NODE_LIMIT, edge_label_limit=EDGE_LABEL_LIMIT, groups=None):
+        import networkx as nx
+        from matplotlib.colors import to_rgba
+        from matplotlib.figure import Figure
+        self.figure = Figure(figsize=figsize)
+        ax = self.figure.add_subplot()
+        self.nodes = list(graph.nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.color = to_rgba(color)
+        self.base_colors = group_colors(self.nodes, groups, to_rgba(base_color))
+        self.facecolors = self.base_colors.copy()
+        self.highlighted = np.array([], dtype=np.int64)
+        self.collection = None
+        if self.nodes:
+            if directed:
+                nx.draw_networkx_edges(graph, pos, ax=ax, arrowstyle='->', arrows=True, edge_color='gray', node_size=node_size)
+            else:
+                nx.draw_networkx_edges(graph, pos, ax=ax, arrows=False)
+            self.collection = nx.draw_networkx_nodes(graph, pos, ax=ax, nodelist=self.nodes,
+                                                     node_color=self.facecolors, node_size=node_size)
+            if len(self.nodes) <= label_limit:
+                nx.draw_networkx_labels(graph, pos, ax=ax, font_size=font_size, font_color='black')
+            if graph.number_of_edges() <= edge_label_limit:
+                edge_labels = nx.get_edge_attributes(graph, 'weight')
+                nx.draw_networkx_edge_labels(graph, pos, ax=ax, edge_labels=edge_labels, font_color='red', font_size=edge_font_size)
+        ax.set_xlim([-zoom, zoom])
+        ax.set_ylim([-zoom, zoom])
+        ax.set_axis_off()
+
+    def update(self, visited_nodes, color=None):
+        from matplotlib.colors import to_rgba
+        if self.collection is None:
+            return
+        self.facecolors[self.highlighted] = self.base_colors[self.highlighted]
+        self.highlighted = np.fromiter((self.index[node] for node in visited_nodes), dtype=np.int64)
+        self.facecolors[self.highlighted] = to_rgba(color) if color is not None else self.color
+        self.collection.set_facecolor(self.facecolors)
+
+class LODGraphRenderer:
+    # Large-graph view: no labels, a random sample of edges in one LineCollection,
+    # and either a plain scatter or (past raster_nodes) a log-density image of
+    # the node cloud. Visited nodes are drawn as an overlay scatter.
+    def __init__(self, graph, pos, zoom, color, directed=False, base_color='lightblue',
+                 node_size=12, figsize=(10, 7), max_edges=EDGE_SAMPLE_LIMIT,
+                 raster_nodes=RASTER_NODE_LIMIT, bins=RASTER_BINS, seed=42, groups=None):
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba
+        from matplotlib.figure import Figure
+        self.figure = Figure(figsize=figsize)
+        ax = self.figure.add_subplot()
+        self.nodes = list(graph.nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.color = to_rgba(color)
+        self.xy = np.array([pos[node] for node in self.nodes], dtype=np.float64).reshape(-1, 2)
+        edges = graph.number_of_edges()
+        if edges > max_edges:
+            keep = np.zeros(edges, dtype=bool)
+            keep[np.random.default_rng(seed).choice(edges, max_edges, replace=False)] = True
+            pairs = [edge for edge, kept in zip(graph.edges, keep.tolist()) if kept]
+        else:
+            pairs = list(graph.edges)
+        if pairs:
+            ends = np.array([(self.index[u], self.index[v]) for u, v in pairs], dtype=np.int64)
+            alpha = min(1.0, 0.3 + 300 / len(pairs))
+            ax.add_collection(LineCollection(self.xy[ends], colors='gray', linewidths=0.4, alpha=alpha))
+        if len(self.nodes) > raster_nodes:
+            density, _, _ = np.histogram2d(self.xy[:, 1], self.xy[:, 0], bins=bins,
+                                           range=[[-zoom, zoom], [-zoom, zoom]])
+            ax.imshow(np.log1p(density), extent=(-zoom, zoom, -zoom, zoom), origin='lower',
+                      cmap='Blues', interpolation='nearest', aspect='auto')
+        elif self.nodes:
+            ax.scatter(self.xy[:, 0], self.xy[:, 1], s=node_size, color=group_colors(self.nodes, groups, to_rgba(base_color)),
+                       edgecolors='none')
+        self.overlay = ax.scatter([], [], s=node_size * 2, color=self.color, edgecolors='none', zorder=3)
+        ax.set_xlim([-zoom, zoom])
+        ax.set_ylim([-zoom, zoom])
+        ax.set_axis_off()
+
+    def update(self, visited_nodes, color=None):
+        from matplotlib.colors import to_rgba
+        ids = np.fromiter((self.index[node] for node in visited_nodes), dtype=np.int64)
+        self.overlay.set_offsets(self.xy[ids])
+        self.overlay.set_color(to_rgba(color) if color is not None else self.color)
+
+def make_graph_renderer(graph, pos, zoom, color, directed=False, lod_limit=LOD_NODE_LIMIT, groups=None, **kwargs):
+    if graph.number_of_nodes() > lod_limit:
+        return LODGraphRenderer(graph, pos, zoom, color, directed, groups=groups)
+    return GraphRenderer(graph, pos, zoom, color, directed, groups=groups, **kwargs)
+
+# ----------------- Array Renderers -----------------
+
+class BarRenderer:
+    def __init__(self, data, color='skyblue', highlight_color='orange', figsize=(10, 4)):
+        from matplotlib.colors import to_rgba
+        from matplotlib.figure import Figure
+        self.figure = Figure(figsize=figsize)
+        ax = self.figure.add_subplot()
+        self.color = to_rgba(color)
+        self.highlight_color = to_rgba(highlight_color)
+        self.bars = ax.bar(range(len(data)), data, color=color)
+        self.highlighted = []
+        top = max(data, default=1)
+        ax.set_ylim(min(0, min(data, default=0)), top * 1.05 if top > 0 else 1)
+
+    def update(self, data, highlights=()):
+        for i in self.highlighted:
+            self.bars[i].set_facecolor(self.color)
+        for bar, value in zip(self.bars, data):
+            bar.set_height(value)
+        self.highlighted = list(highlights)
+        for i in self.highlighted:
+            self.bars[i].set_facecolor(self.highlight_color)
+
+class CellRenderer:
+    def __init__(self, data, default_color='skyblue', highlight_color='orange', figsize=None):
+        if figsize is None:
+            figsize = (max(10, len(data) // 2), 2)
+        from matplotlib.colors import to_rgba
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Rectangle
+        self.figure = Figure(figsize=figsize)
+        ax = self.figure.add_subplot()
+        self.default_color = to_rgba(default_color)
+        self.highlight_color = to_rgba(highlight_color)
+        self.cells = []
+        self.labels = []
+        for i, val in enumerate(data):
+            cell = Rectangle((i, 0), 1, 1, facecolor=self.default_color, edgecolor='black')
+            ax.add_patch(cell)
+            self.cells.append(cell)
+            self.labels.append(ax.text(i + 0.5, 0.5, str(val), ha='center', va='center', fontsize=12, color='black'))
+        self.highlighted = []
+        ax.set_xlim(0, len(data))
+        ax.set_ylim(0, 1)
+        ax.axis('off')
+
+    def update(self, data, highlights=()):
+        for i in self.highlighted:
+            self.cells[i].set_facecolor(self.default_color)
+        for label, value in zip(self.labels, data):
+            label.set_text(str(value))
+        self.highlighted = list(highlights)
+        for i in self.highlighted:
+            self.cells[i].set_facecolor(self.highlight_color)
+
+class OverviewRenderer:
+    # Long-array view: values are reduced into at most `bins` buckets (a strided
+    # sample for "bars", the bucket mean for "heatmap") so each frame costs one
+    # NumPy pass instead of one artist per element. Highlights mark their bucket.
+    def __init__(self, data, color='skyblue', highlight_color='orange', figsize=(10, 4),
+                 bins=ARRAY_BINS, mode="bars"):
+        from matplotlib.figure import Figure
+        self.figure = Figure(figsize=figsize)
+        ax = self.figure.add_subplot()
+        values = np.asarray(data, dtype=np.float64)
+        self.n = len(values)
+        self.mode = mode
+        self.starts = np.linspace(0, self.n, min(bins, self.n) + 1).astype(np.int64)[:-1]
+        self.width = self.n / max(len(self.starts), 1)
+        reduced = self._reduce(values)
+        edges = np.append(self.starts, self.n)
+        if mode == "heatmap":
+            self.image = ax.imshow(reduced[np.newaxis, :], extent=(0, self.n, 0, 1), aspect='auto',
+                                   cmap='viridis', interpolation='nearest',
+                                   vmin=values.min(initial=0), vmax=values.max(initial=1))
+            ax.set_yticks([])
+            top = 1
+        else:
+            self.image = ax.stairs(reduced, edges, fill=True, color=color)
+            top = values.max(initial=1)
+            ax.set_ylim(min(0, values.min(initial=0)), top * 1.05 if top > 0 else 1)
+        self.overlay = ax.scatter([], [], marker='v', color=highlight_color, zorder=3)
+        self.marker_y = top
+        ax.set_xlim(0, max(self.n, 1))
+
+    def _reduce(self, values):
+        if self.n == 0:
+            return values
+        if self.mode == "heatmap":
+            sums = np.add.reduceat(values, self.starts)
+            return sums / np.diff(np.append(self.starts, self.n))
+        return values[self.starts]
+
+    def update(self, data, highlights=()):
+        reduced = self._reduce(np.asarray(data, dtype=np.float64))
+        if self.mode == "heatmap":
+            self.image.set_data(reduced[np.newaxis, :])
+        else:
+            self.image.set_data(reduced)
+        buckets = np.unique(np.searchsorted(self.starts, np.asarray(list(highlights), dtype=np.int64), side='right') - 1)
+        x = self.starts[buckets] + self.width / 2
+        self.overlay.set_offsets(np.column_stack([x, np.full(len(x), self.marker_y)]))
+
+def make_array_renderer(data, kind="bars", color='skyblue', highlight_color='orange', mode="bars",
+                        cell_limit=CELL_LIMIT, bar_limit=BAR_LIMIT):
+    if len(data) > bar_limit:
+        return OverviewRenderer(data, color, highlight_color, mode=mode)
+    if kind == "cells" and len(data) <= cell_limit:
+        return CellRenderer(data, color, highlight_color)
+    return BarRenderer(data, color, highlight_color)
+
+# ----------------- Playback and Export -----------------
+
+def apply_frame(renderer, frame):
+    if isinstance(frame, tuple):
+        renderer.update(*frame)
+    else:
+        renderer.update(frame)
+
+def export_animation(renderer, frames, path=None, fps=2, dpi=80):
+    from matplotlib.animation import FFMpegWriter, PillowWriter
+    temporary = path is None
+    if temporary:
+        path = tempfile.NamedTemporaryFile(suffix=".gif", delete=False).name
+    writer = FFMpegWriter(fps=fps) if path.endswith(".mp4") else PillowWriter(fps=fps)
+    try:
+        with writer.saving(renderer.figure, path, dpi):
+            for frame in frames:
+                apply_frame(renderer, frame)
+                writer.grab_frame()
+    except BaseException:
+        if temporary:
+            os.remove(path)
+        raise
+    return path
+
+def export_animation_async(renderer, frames, path=None, fps=2, dpi=80):
+    return _export_pool.submit(export_animation, renderer, frames, path, fps, dpi)
@@ -0,0 +1,61 @@
+# LRU cache for algorithm results, keyed by graph version and run parameters
+
+import sys
+from collections import OrderedDict
+
+from step_trace import StepTrace
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+# ----------------- Size Estimation -----------------
+
+def approx_size(value):
+    if isinstance(value, StepTrace):
+        return approx_size(value.events) + approx_size(value.initial) + sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(approx_size(item) for item in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+# ----------------- Result Cache -----------------
+
+class ResultCache:
+    def __init__(self, max_bytes=DEFAULT_BUDGET):
+        self.max_bytes = max_bytes
+        self.version = None
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.last_hit = False
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def get(self, version, key, compute):
+        if version != self.version:
+            self.clear()
+            self.version = version
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.last_hit = True
+            return self._entries[key][0]
+        self.misses += 1
+        self.last_hit = False
+        value = compute()
+        size = approx_size(value)
+        if size <= self.max_bytes:
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted
+        return value
@@ -0,0 +1,285 @@
+# Shortest-path engines: early-exit Dijkstra (UCS), A*, bidirectional Dijkstra and dynamic SSSP
+
+import heapq
+import math
+
+def edge_weight(graph, u, v):
+    return graph[u][v].get('weight', 1)
+
+def reconstruct_path(parents, target):
+    if target not in parents:
+        return []
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
+
+# ----------------- Dijkstra / Uniform-Cost Search -----------------
+
+def dijkstra_search(graph, start_node, target=None):
+    queue = [(0, start_node)]
+    costs = {start_node: 0}
+    parents = {start_node: None}
+    settled = set()
+    order = []
+    while queue:
+        cost, node = heapq.heappop(queue)
+        if node in settled or cost > costs[node]:
+            continue
+        settled.add(node)
+        order.append(node)
+        if node == target:
+            break
+        for neighbor in graph.neighbors(node):
+            new_cost = cost + edge_weight(graph, node, neighbor)
+            if neighbor not in costs or new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heapq.heappush(queue, (new_cost, neighbor))
+    return order, costs, parents
+
+# ----------------- A* Search -----------------
+
+def euclidean_heuristic(graph, pos):
+    # Scale layout distances by the smallest weight/length ratio over all edges
+    # so the estimate never exceeds the true remaining cost.
+    scale = math.inf
+    for u, v, data in graph.edges(data=True):
+        length = math.dist(pos[u], pos[v])
+        if length == 0:
+            scale = 0
+            break
+        scale = min(scale, data.get('weight', 1) / length)
+    if scale == math.inf:
+        scale = 0
+
+    def heuristic(node, target):
+        return scale * math.dist(pos[node], pos[target])
+    return heuristic
+
+def astar_search(graph, start_node, target, heuristic):
+    queue = [(heuristic(start_node, target), 0, start_node)]
+    costs = {start_node: 0}
+    parents = {start_node: None}
+    settled = set()
+    order = []
+    while queue:
+        _, cost, node = heapq.heappop(queue)
+        if node in settled or cost > costs[node]:
+            continue
+        settled.add(node)
+        order.append(node)
+        if node == target:
+            break
+        for neighbor in graph.neighbors(node):
+            new_cost = cost + edge_weight(graph, node, neighbor)
+            if neighbor not in costs or new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heapq.heappush(queue, (new_cost + heuristic(neighbor, target), new_cost, neighbor))
+    return order, costs, parents
+
+# ----------------- Bidirectional Dijkstra -----------------
+
+def bidirectional_dijkstra(graph, start_node, target):
+    if start_node == target:
+        return 0, [start_node], [start_node]
+    if graph.is_directed():
+        backward_neighbors = graph.predecessors
+        backward_weight = lambda node, neighbor: edge_weight(graph, neighbor, node)
+    else:
+        backward_neighbors = graph.neighbors
+        backward_weight = lambda node, neighbor: edge_weight(graph, node, neighbor)
+    forward_weight = lambda node, neighbor: edge_weight(graph, node, neighbor)
+
+    sides = [
+        ([(0, start_node)], {start_node: 0}, {start_node: None}, set(), graph.neighbors, forward_weight),
+        ([(0, target)], {target: 0}, {target: None}, set(), backward_neighbors, backward_weight),
+    ]
+    best = math.inf
+    meeting = None
+    order = []
+    while sides[0][0] and sides[1][0]:
+        if sides[0][0][0][0] + sides[1][0][0][0] >= best:
+            break
+        side = 0 if sides[0][0][0][0] <= sides[1][0][0][0] else 1
+        queue, costs, parents, settled, neighbors, weight = sides[side]
+        other_costs = sides[1 - side][1]
+        cost, node = heapq.heappop(queue)
+        if node in settled or cost > costs[node]:
+            continue
+        settled.add(node)
+        order.append(node)
+        for neighbor in neighbors(node):
+            new_cost = cost + weight(node, neighbor)
+            if neighbor not in costs or new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heapq.heappush(queue, (new_cost, neighbor))
+            if neighbor in other_costs and costs[neighbor] + other_costs[neighbor] < best:
+                best = costs[neighbor] + other_costs[neighbor]
+                meeting = neighbor
+
+    if meeting is None:
+        return math.inf, [], order
+    path = reconstruct_path(sides[0][2], meeting)
+    node = sides[1][2][meeting]
+    while node is not None:
+        path.append(node)
+        node = sides[1][2][node]
+    return best, path, order
+
+# ----------------- Single-Pair Queries -----------------
+
+def shortest_path(graph, start_node, target, heuristic=None):
+    if heuristic is None:
+        _, costs, parents = dijkstra_search(graph, start_node, target)
+    else:
+        _, costs, parents = astar_search(graph, start_node, target, heuristic)
+    if target not in costs:
+        return math.inf, []
+    return costs[target], reconstruct_path(parents, target)
+
+# ----------------- Dynamic Single-Source Shortest Paths -----------------
+
+class DynamicSSSP:
+    # Keeps Dijkstra distances and the shortest-path tree from one source valid
+    # across edge edits. Improvements propagate outward from the edited edge;
+    # removals and weight increases re-solve only the subtree hanging below it.
+    def __init__(self, graph, source):
+        self.graph = graph
+        self.source = source
+        _, self.costs, self.parents = dijkstra_search(graph, source)
+        self.children = {node: set() for node in self.costs}
+        for node, parent in self.parents.items():
+            if parent is not None:
+                self.children[parent].add(node)
+        self.touched = len(self.costs)
+
+    def path(self, target):
+        return reconstruct_path(self.parents, target)
+
+    def _predecessors(self, node):
+        return self.graph.predecessors(node) if self.graph.is_directed() else self.graph.neighbors(node)
+
+    def _set_parent(self, node, parent):
+        old = self.parents.get(node)
+        if old is not None and old in self.children:
+            self.children[old].discard(node)
+        self.parents[node] = parent
+        self.children.setdefault(node, set())
+        if parent is not None:
+            self.children[parent].add(node)
+
+    def _propagate(self, queue, region=None):
+        costs = self.costs
+        while queue:
+            cost, node = heapq.heappop(queue)
+            if cost > costs.get(node, math.inf):
+                continue
+            self.touched += 1
+            for neighbor in self.graph.neighbors(node):
+                if region is not None and neighbor not in region:
+                    continue
+                new_cost = cost + edge_weight(self.graph, node, neighbor)
+                if new_cost < costs.get(neighbor, math.inf):
+                    costs[neighbor] = new_cost
+                    self._set_parent(neighbor, node)
+                    heapq.heappush(queue, (new_cost, neighbor))
+
+    def _subtree(self, root):
+        nodes = [root]
+        stack = [root]
+        while stack:
+            for child in self.children.get(stack.pop(), ()):
+                nodes.append(child)
+                stack.append(child)
+        return nodes
+
+    def _repair(self, region):
+        # Forget the region, reattach each node to its best surviving
+        # predecessor, then run Dijkstra inside the region only.
+        region = set(region)
+        for node in region:
+            self.costs.pop(node, None)
+        queue = []
+        for node in region:
+            if not self.graph.has_node(node):
+                continue
+            best, parent = math.inf, None
+            for pred in self._predecessors(node):
+                if pred in region or pred not in self.costs:
+                    continue
+                cost = self.costs[pred] + edge_weight(self.graph, pred, node)
+                if cost < best:
+                    best, parent = cost, pred
+            if parent is None:
+                self._set_parent(node, None)
+                del self.parents[node]
+                continue
+            self.costs[node] = best
+            self._set_parent(node, parent)
+            queue.append((best, node))
+        heapq.heapify(queue)
+        self._propagate(queue, region)
+        for node in region:
+            if node not in self.costs:
+                self.parents.pop(node, None)
+
+    def _edge_set(self, u, v):
+        if u not in self.costs:
+            return
+        new_cost = self.costs[u] + edge_weight(self.graph, u, v)
+        if new_cost < self.costs.get(v, math.inf):
+            self.costs[v] = new_cost
+            self._set_parent(v, u)
+            self._propagate([(new_cost, v)])
+        elif self.parents.get(v) == u and new_cost > self.costs[v]:
+            self._repair(self._subtree(v))
+
+    def _edge_removed(self, u, v):
+        if self.parents.get(v) == u:
+            self._repair(self._subtree(v))
+
+    def add_edge(self, u, v):
+        # Insertion or reweight of an edge that is already in self.graph.
+        self.touched = 0
+        self._edge_set(u, v)
+        if not self.graph.is_directed():
+            self._edge_set(v, u)
+
+    def remove_edge(self, u, v):
+        self.touched = 0
+        self._edge_removed(u, v)
+        if not self.graph.is_directed():
+            self._edge_removed(v, u)
+
+    def remove_node(self, node):
+        self.touched = 0
+        if node == self.source:
+            self.costs, self.parents, self.children = {}, {}, {}
+            return
+        if node not in self.costs:
+            return
+        region = self._subtree(node)
+        for child in self.children.pop(node, ()):
+            self.parents[child] = None
+        parent = self.parents.pop(node)
+        self.children[parent].discard(node)
+        del self.costs[node]
+        region.remove(node)
+        self._repair(region)
+
+    def apply(self, op, *args):
+        # Mirror a graph_store mutation after it has been applied to self.graph.
+        if op == "add_edge":
+            self.add_edge(args[0], args[1])
+        elif op == "remove_edge":
+            self.remove_edge(args[0], args[1])
+        elif op == "remove_node":
+            self.remove_node(args[0])
+        else:
+            self.touched = 0
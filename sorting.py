@@ -0,0 +1,388 @@
+# Sorting algorithms; pass a StepTrace to record animation steps
+
+import os
+from bisect import bisect_left, bisect_right
+
+from counters import active
+
+# ----------------- Quadratic Sorts -----------------
+
+def insertion_sort(arr, trace=None, ops=None):
+    count_comparisons, count_swaps = active(ops, "comparisons", "swaps")
+    for i in range(1, len(arr)):
+        j = i
+        while j > 0:
+            if count_comparisons:
+                ops.comparisons += 1
+            if not arr[j-1] > arr[j]:
+                break
+            arr[j], arr[j-1] = arr[j-1], arr[j]
+            if count_swaps:
+                ops.swaps += 1
+            if trace is not None:
+                trace.swap(j, j-1)
+            j -= 1
+    return arr
+
+def selection_sort(arr, trace=None, ops=None):
+    count_comparisons, count_swaps = active(ops, "comparisons", "swaps")
+    for i in range(len(arr)):
+        min_idx = i
+        for j in range(i+1, len(arr)):
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+        if count_comparisons:
+            ops.comparisons += len(arr) - i - 1
+        if count_swaps:
+            ops.swaps += 1
+        arr[i], arr[min_idx] = arr[min_idx], arr[i]
+        if trace is not None:
+            trace.swap(i, min_idx)
+    return arr
+
+# ----------------- Divide and Conquer Sorts -----------------
+
+def merge_sort(arr, trace=None, ops=None):
+    count_comparisons, count_writes = active(ops, "comparisons", "writes")
+
+    def merge_sort_helper(array, l, r):
+        if r - l > 1:
+            m = (l + r) // 2
+            yield from merge_sort_helper(array, l, m)
+            yield from merge_sort_helper(array, m, r)
+            left, right = array[l:m], array[m:r]
+            i = j = 0
+            for k in range(l, r):
+                if count_writes:
+                    ops.writes += 1
+                if count_comparisons and i < len(left) and j < len(right):
+                    ops.comparisons += 1
+                if j >= len(right) or (i < len(left) and left[i] < right[j]):
+                    value = left[i]
+                    i += 1
+                else:
+                    value = right[j]
+                    j += 1
+                if trace is not None:
+                    trace.write(k, array[k], value)
+                array[k] = value
+                yield array
+    yield from merge_sort_helper(arr, 0, len(arr))
+
+def quick_sort(arr, trace=None, ops=None):
+    count_comparisons, count_swaps = active(ops, "comparisons", "swaps")
+
+    def quick_sort_helper(array, low, high):
+        if low < high:
+            pivot = array[high]
+            i = low
+            if count_comparisons:
+                ops.comparisons += high - low
+            for j in range(low, high):
+                if array[j] < pivot:
+                    array[i], array[j] = array[j], array[i]
+                    if count_swaps:
+                        ops.swaps += 1
+                    if trace is not None:
+                        trace.swap(i, j)
+                    i += 1
+                    yield array
+            array[i], array[high] = array[high], array[i]
+            if count_swaps:
+                ops.swaps += 1
+            if trace is not None:
+                trace.swap(i, high)
+            yield array
+            yield from quick_sort_helper(array, low, i - 1)
+            yield from quick_sort_helper(array, i + 1, high)
+    yield from quick_sort_helper(arr, 0, len(arr) - 1)
+
+# ----------------- Introsort -----------------
+
+INTROSORT_SMALL = 16
+
+def introsort(arr, trace=None, small=INTROSORT_SMALL):
+    if len(arr) > 1:
+        depth_limit = 2 * len(arr).bit_length()
+        yield from _introsort(arr, 0, len(arr) - 1, depth_limit, trace, small)
+
+def _swap(array, i, j, trace):
+    array[i], array[j] = array[j], array[i]
+    if trace is not None:
+        trace.swap(i, j)
+
+def _median3(a, b, c):
+    if a < b:
+        return b if b < c else (c if a < c else a)
+    return a if a < c else (c if b < c else b)
+
+def _choose_pivot(array, low, high):
+    mid = (low + high) // 2
+    if high - low > 40:
+        step = (high - low) // 8
+        return _median3(
+            _median3(array[low], array[low + step], array[low + 2 * step]),
+            _median3(array[mid - step], array[mid], array[mid + step]),
+            _median3(array[high - 2 * step], array[high - step], array[high]),
+        )
+    return _median3(array[low], array[mid], array[high])
+
+def _introsort(array, low, high, depth, trace, small):
+    while high - low + 1 > small:
+        if depth == 0:
+            yield from _heap_sort_range(array, low, high, trace)
+            return
+        depth -= 1
+        pivot = _choose_pivot(array, low, high)
+        # Three-way (Dutch flag) partition: [low, lt) < pivot, [lt, i) == pivot, (gt, high] > pivot
+        lt, i, gt = low, low, high
+        while i <= gt:
+            if array[i] < pivot:
+                if lt != i:
+                    _swap(array, lt, i, trace)
+                    yield array
+                lt += 1
+                i += 1
+            elif pivot < array[i]:
+                _swap(array, i, gt, trace)
+                yield array
+                gt -= 1
+            else:
+                i += 1
+        # Recurse into the smaller side and loop on the larger one to keep the stack shallow.
+        if lt - low < high - gt:
+            yield from _introsort(array, low, lt - 1, depth, trace, small)
+            low = gt + 1
+        else:
+            yield from _introsort(array, gt + 1, high, depth, trace, small)
+            high = lt - 1
+    yield from _insertion_sort_range(array, low, high, trace)
+
+def _insertion_sort_range(array, low, high, trace):
+    for i in range(low + 1, high + 1):
+        j = i
+        while j > low and array[j] < array[j-1]:
+            _swap(array, j, j-1, trace)
+            yield array
+            j -= 1
+
+def _heap_sort_range(array, low, high, trace):
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        yield from _sift_down(array, low, root, size, trace)
+    for end in range(size - 1, 0, -1):
+        _swap(array, low, low + end, trace)
+        yield array
+        yield from _sift_down(array, low, 0, end, trace)
+
+def _sift_down(array, offset, root, size, trace):
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and array[offset + child] < array[offset + child + 1]:
+            child += 1
+        if not array[offset + root] < array[offset + child]:
+            return
+        _swap(array, offset + root, offset + child, trace)
+        yield array
+        root = child
+
+# ----------------- Buffered Merge Sort -----------------
+
+MIN_GALLOP = 7
+STEP_MIN_RUN = 4
+MERGE_STRATEGIES = ["natural", "bottom_up", "parallel"]
+
+def buffered_merge_sort(arr, strategy="natural", steps=False, trace=None, workers=None, min_run=None):
+    if strategy not in MERGE_STRATEGIES:
+        raise ValueError(f"unknown merge strategy: {strategy}")
+    if steps or trace is not None:
+        if strategy == "parallel":
+            raise ValueError("the parallel merge sort does not record steps")
+        return _merge_sort_steps(arr, strategy == "natural", trace, min_run or STEP_MIN_RUN)
+    if strategy == "parallel":
+        return parallel_merge_sort(arr, workers)
+    _merge_runs(arr, _prepare_runs(arr, strategy == "natural", min_run or _min_run(len(arr))))
+    return arr
+
+def _min_run(n):
+    # Same choice as Timsort: a run length in [32, 64] that splits n into ~power-of-two runs.
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def _reverse(arr, lo, hi):
+    hi -= 1
+    while lo < hi:
+        arr[lo], arr[hi] = arr[hi], arr[lo]
+        lo += 1
+        hi -= 1
+
+def _binary_insertion(arr, lo, start, end):
+    for i in range(start, end):
+        value = arr[i]
+        pos = bisect_right(arr, value, lo, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = value
+
+def _prepare_runs(arr, natural, min_run):
+    n = len(arr)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if natural and hi < n:
+            if arr[hi] < arr[lo]:
+                hi += 1
+                while hi < n and arr[hi] < arr[hi-1]:
+                    hi += 1
+                _reverse(arr, lo, hi)
+            else:
+                hi += 1
+                while hi < n and not arr[hi] < arr[hi-1]:
+                    hi += 1
+        end = min(n, lo + min_run)
+        if hi < end:
+            _binary_insertion(arr, lo, hi, end)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+    return bounds
+
+def _merge_into(src, dst, lo, mid, hi):
+    if not src[mid] < src[mid-1]:
+        dst[lo:hi] = src[lo:hi]
+        return
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            left_wins = 0
+            right_wins += 1
+            if right_wins >= MIN_GALLOP:
+                end = bisect_left(src, src[i], j, hi)
+                dst[k:k + end - j] = src[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            right_wins = 0
+            left_wins += 1
+            if left_wins >= MIN_GALLOP and i < mid:
+                end = bisect_right(src, src[j], i, mid)
+                dst[k:k + end - i] = src[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    elif j < hi:
+        dst[k:hi] = src[j:hi]
+
+def _merge_runs(arr, bounds):
+    # Ping-pong between arr and a single preallocated buffer, one pass per level.
+    aux = [None] * len(arr)
+    src, dst = arr, aux
+    while len(bounds) > 2:
+        merged = [0]
+        for i in range(0, len(bounds) - 1, 2):
+            lo = bounds[i]
+            if i + 2 < len(bounds):
+                hi = bounds[i + 2]
+                _merge_into(src, dst, lo, bounds[i + 1], hi)
+            else:
+                hi = bounds[i + 1]
+                dst[lo:hi] = src[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+def _merge_sort_steps(arr, natural, trace, min_run):
+    n = len(arr)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if natural and hi < n:
+            if arr[hi] < arr[lo]:
+                hi += 1
+                while hi < n and arr[hi] < arr[hi-1]:
+                    hi += 1
+                i, j = lo, hi - 1
+                while i < j:
+                    _swap(arr, i, j, trace)
+                    yield arr
+                    i += 1
+                    j -= 1
+            else:
+                hi += 1
+                while hi < n and not arr[hi] < arr[hi-1]:
+                    hi += 1
+        end = min(n, lo + min_run)
+        if hi < end:
+            yield from _insertion_sort_range(arr, lo, end - 1, trace)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+
+    aux = [None] * n
+    while len(bounds) > 2:
+        merged = [0]
+        for b in range(0, len(bounds) - 1, 2):
+            if b + 2 >= len(bounds):
+                merged.append(bounds[b + 1])
+                continue
+            lo, mid, hi = bounds[b], bounds[b + 1], bounds[b + 2]
+            merged.append(hi)
+            if not arr[mid] < arr[mid-1]:
+                continue
+            for k in range(lo, hi):
+                aux[k] = arr[k]
+            i, j = lo, mid
+            for k in range(lo, hi):
+                if j >= hi or (i < mid and not aux[j] < aux[i]):
+                    value = aux[i]
+                    i += 1
+                else:
+                    value = aux[j]
+                    j += 1
+                if trace is not None:
+                    trace.write(k, arr[k], value)
+                arr[k] = value
+                yield arr
+        bounds = merged
+
+# ----------------- Parallel Merge Sort -----------------
+
+PARALLEL_MIN_CHUNK = 100_000
+
+def _sort_chunk(chunk):
+    return buffered_merge_sort(chunk)
+
+def parallel_merge_sort(arr, workers=None, min_chunk=PARALLEL_MIN_CHUNK):
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, n // min_chunk)
+    if workers < 2:
+        return buffered_merge_sort(arr)
+    size = -(-n // workers)
+    bounds = list(range(0, n, size)) + [n]
+    chunks = (arr[lo:hi] for lo, hi in zip(bounds, bounds[1:]))
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for lo, chunk in zip(bounds, pool.map(_sort_chunk, chunks)):
+            arr[lo:lo + len(chunk)] = chunk
+    return _merge_runs(arr, bounds)
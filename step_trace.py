@@ -0,0 +1,108 @@
+# Delta-encoded step traces: one event per animation step, frames rebuilt on demand
+
+# ----------------- Step Trace -----------------
+
+class StepTrace:
+    def __init__(self, initial=()):
+        self.initial = list(initial)
+        self.events = []
+        self._state = list(initial)
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self.events) + 1
+
+    def __getitem__(self, index):
+        return self.frame(index)
+
+    def __iter__(self):
+        return self.frames()
+
+    # -------- Recording --------
+
+    def visit(self, node):
+        self.events.append(("visit", node))
+
+    def swap(self, i, j):
+        self.events.append(("swap", i, j))
+
+    def write(self, k, old, new):
+        self.events.append(("write", k, old, new))
+
+    def write_block(self, start, old, new):
+        self.events.append(("block", start, list(old), list(new)))
+
+    # -------- Replay --------
+
+    def copy(self):
+        # Shares the recorded events but has its own replay cursor, so a cached
+        # trace can be replayed by a player and an exporter at the same time.
+        trace = StepTrace(self.initial)
+        trace.events = self.events
+        return trace
+
+    def _apply(self, event):
+        state = self._state
+        if event[0] == "visit":
+            state.append(event[1])
+        elif event[0] == "swap":
+            i, j = event[1], event[2]
+            state[i], state[j] = state[j], state[i]
+        elif event[0] == "block":
+            state[event[1]:event[1] + len(event[3])] = event[3]
+        else:
+            state[event[1]] = event[3]
+
+    def _revert(self, event):
+        state = self._state
+        if event[0] == "visit":
+            state.pop()
+        elif event[0] == "swap":
+            i, j = event[1], event[2]
+            state[i], state[j] = state[j], state[i]
+        elif event[0] == "block":
+            state[event[1]:event[1] + len(event[2])] = event[2]
+        else:
+            state[event[1]] = event[2]
+
+    def seek(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("step index out of range")
+        while self._cursor < index:
+            self._apply(self.events[self._cursor])
+            self._cursor += 1
+        while self._cursor > index:
+            self._cursor -= 1
+            self._revert(self.events[self._cursor])
+        return self._state
+
+    def frame(self, index):
+        return self.seek(index)[:]
+
+    def highlights(self, index):
+        if index < 0:
+            index += len(self)
+        if index == 0:
+            return []
+        event = self.events[index - 1]
+        if event[0] == "swap":
+            return [event[1], event[2]]
+        if event[0] == "block":
+            return list(range(event[1], event[1] + len(event[3])))
+        return [event[1]]
+
+    def frames(self, start=0):
+        for index in range(start, len(self)):
+            yield self.seek(index)
+
+    def frames_with_highlights(self, start=0):
+        for index in range(start, len(self)):
+            yield self.seek(index), self.highlights(index)
+
+def visit_trace(order):
+    trace = StepTrace()
+    for node in order:
+        trace.visit(node)
+    return trace
@@ -0,0 +1,228 @@
+# Persistent task storage: append-only log with tombstones and compaction, a
+# Fenwick tree for O(log n) positional lookup and a token index for search
+
+import json
+import os
+import re
+
+COMPACT_MIN = 1000
+COMPACT_RATIO = 0.5
+BULK_REBUILD = 1024
+
+def tokenize(text):
+    return re.findall(r"\w+", text.lower())
+
+class TaskStore:
+    # Tasks live in insertion slots; deleted slots hold None until the log is
+    # compacted. Positions shown to the user (1-based) are ranks among live
+    # slots, answered by the Fenwick tree in O(log n).
+    def __init__(self, path="tasks.log", compact_min=COMPACT_MIN, compact_ratio=COMPACT_RATIO):
+        self.path = path
+        self.compact_min = compact_min
+        self.compact_ratio = compact_ratio
+        self.texts = []
+        self.tree = [0]
+        self.live = 0
+        self.dead = 0
+        self._tokens = None
+        self._log = None
+        self._load()
+
+    def __len__(self):
+        return self.live
+
+    # -------- Log --------
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        try:
+            entries = json.loads("[" + ",".join(lines) + "]")
+        except ValueError:
+            entries = []
+            for line in lines:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue   # torn write from an interrupted append
+        texts = self.texts
+        for entry in entries:
+            if entry[0] == "add":
+                texts.append(entry[1])
+            elif 0 <= entry[1] < len(texts):
+                texts[entry[1]] = None
+        self._build_tree()
+        self.dead = len(entries) - self.live
+
+    def _write(self, entries):
+        if self._log is None:
+            self._log = open(self.path, "a+", encoding="utf-8")
+            if self._log.tell() > 0:
+                self._log.seek(self._log.tell() - 1)
+                if self._log.read(1) != "\n":
+                    self._log.write("\n")
+        self._log.write("".join(json.dumps(entry) + "\n" for entry in entries))
+        self._log.flush()
+
+    def compact(self):
+        live = [text for text in self.texts if text is not None]
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(["add", text]) + "\n" for text in live))
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        os.replace(temp_path, self.path)
+        self.texts = live
+        self._build_tree()
+        self.dead = 0
+        self._tokens = None
+
+    def _maybe_compact(self):
+        if self.dead >= self.compact_min and self.dead > self.compact_ratio * (self.live + self.dead):
+            self.compact()
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    # -------- Fenwick Tree --------
+
+    def _build_tree(self):
+        n = len(self.texts)
+        tree = [0] * (n + 1)
+        for i, text in enumerate(self.texts, 1):
+            if text is not None:
+                tree[i] += 1
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.live = sum(text is not None for text in self.texts)
+
+    def _prefix(self, i):
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def _append_slot(self):
+        i = len(self.tree)
+        self.tree.append(1 + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+
+    def _clear_slot(self, slot):
+        i = slot + 1
+        while i < len(self.tree):
+            self.tree[i] -= 1
+            i += i & -i
+
+    def _slot(self, position):
+        # Slot of the position-th live task (binary lifting over the tree).
+        n = len(self.tree) - 1
+        pos = 0
+        step = 1 << n.bit_length()
+        while step:
+            if pos + step <= n and self.tree[pos + step] < position:
+                pos += step
+                position -= self.tree[pos]
+            step >>= 1
+        return pos
+
+    def position(self, slot):
+        return self._prefix(slot + 1)
+
+    # -------- Tasks --------
+
+    def add(self, text):
+        self.add_many([text])
+
+    def add_many(self, texts):
+        texts = list(texts)
+        start = len(self.texts)
+        self.texts.extend(texts)
+        if len(texts) > BULK_REBUILD:
+            self._build_tree()
+        else:
+            for _ in texts:
+                self._append_slot()
+            self.live += len(texts)
+        if self._tokens is not None:
+            for slot in range(start, len(self.texts)):
+                self._index(slot, self.texts[slot])
+        self._write(["add", text] for text in texts)
+
+    def import_file(self, path):
+        with open(path, encoding="utf-8") as f:
+            texts = [line.rstrip("\r\n") for line in f if line.strip()]
+        self.add_many(texts)
+        return len(texts)
+
+    def get(self, position):
+        if not 1 <= position <= self.live:
+            raise IndexError("task position out of range")
+        return self.texts[self._slot(position)]
+
+    def delete(self, position):
+        if not 1 <= position <= self.live:
+            raise IndexError("task position out of range")
+        slot = self._slot(position)
+        text = self.texts[slot]
+        self.texts[slot] = None
+        self._clear_slot(slot)
+        self.live -= 1
+        self.dead += 2
+        if self._tokens is not None:
+            for token in set(tokenize(text)):
+                self._tokens[token].discard(slot)
+        self._write([["del", slot]])
+        self._maybe_compact()
+        return text
+
+    def page(self, number, size=20):
+        # (position, text) pairs for a 1-based page, walking forward from
+        # the first slot instead of materialising the whole list.
+        first = (number - 1) * size + 1
+        if not 1 <= first <= self.live:
+            return []
+        results = []
+        slot = self._slot(first)
+        position = first
+        while slot < len(self.texts) and len(results) < size:
+            if self.texts[slot] is not None:
+                results.append((position, self.texts[slot]))
+                position += 1
+            slot += 1
+        return results
+
+    # -------- Search --------
+
+    def _index(self, slot, text):
+        for token in set(tokenize(text)):
+            self._tokens.setdefault(token, set()).add(slot)
+
+    def search(self, query, limit=None):
+        # Every query word must appear inside some word of the task
+        # (so "mil" finds "milk"); matching scans the vocabulary, not the tasks.
+        words = tokenize(query)
+        if not words:
+            return []
+        if self._tokens is None:
+            self._tokens = {}
+            for slot, text in enumerate(self.texts):
+                if text is not None:
+                    self._index(slot, text)
+        matches = None
+        for word in words:
+            slots = set()
+            for token, postings in self._tokens.items():
+                if word in token:
+                    slots |= postings
+            matches = slots if matches is None else matches & slots
+            if not matches:
+                return []
+        found = sorted(matches)[:limit]
+        return [(self.position(slot), self.texts[slot]) for slot in found]
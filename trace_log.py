@@ -0,0 +1,126 @@
+# Buffered, background, compressed step-trace logging
+
+import atexit
+import glob
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+
+from step_trace import StepTrace
+
+SUFFIX = ".jsonl.gz"
+
+# ----------------- Trace Logger -----------------
+
+class TraceLogger:
+    def __init__(self, directory="logs", max_file_bytes=16 * 1024 * 1024,
+                 max_total_bytes=256 * 1024 * 1024, chunk_size=4096):
+        self.directory = directory
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.chunk_size = chunk_size
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.errors = 0
+        self.last_error = None
+
+    def submit(self, name, events, initial=None):
+        run = f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        base = os.path.join(self.directory, run)
+        self._start()
+        self._queue.put((base, events, initial))
+        return base
+
+    def flush(self):
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trace-logger", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+                self._enforce_total_cap()
+            except Exception as e:
+                # Keep draining: a dead writer would leave flush() waiting forever.
+                self.errors += 1
+                self.last_error = e
+            finally:
+                self._queue.task_done()
+
+    def _write(self, base, events, initial):
+        os.makedirs(self.directory, exist_ok=True)
+        part = 0
+        raw = open(f"{base}.{part:04d}{SUFFIX}", "wb")
+        out = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+        try:
+            if initial is not None:
+                out.write((json.dumps(["init", list(initial)], default=str) + "\n").encode())
+            for start in range(0, len(events), self.chunk_size):
+                chunk = events[start:start + self.chunk_size]
+                out.write("".join(json.dumps(event, default=str) + "\n" for event in chunk).encode())
+                if raw.tell() >= self.max_file_bytes:
+                    out.close()
+                    raw.close()
+                    part += 1
+                    raw = open(f"{base}.{part:04d}{SUFFIX}", "wb")
+                    out = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+        finally:
+            out.close()
+            raw.close()
+
+    def _enforce_total_cap(self):
+        files = [(os.path.getmtime(path), os.path.getsize(path), path)
+                 for path in glob.glob(os.path.join(self.directory, "*" + SUFFIX))]
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_total_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+# ----------------- Trace Reader -----------------
+
+def trace_parts(base):
+    return sorted(glob.glob(glob.escape(base) + ".*" + SUFFIX))
+
+def read_trace(base, with_header=False):
+    for part in trace_parts(base):
+        with gzip.open(part, "rt") as f:
+            for line in f:
+                record = json.loads(line)
+                if record[0] == "init" and not with_header:
+                    continue
+                yield tuple(record)
+
+def load_trace(base):
+    trace = None
+    for record in read_trace(base, with_header=True):
+        if trace is None:
+            trace = StepTrace(record[1] if record[0] == "init" else ())
+            if record[0] == "init":
+                continue
+        trace.events.append(record)
+    return trace if trace is not None else StepTrace()